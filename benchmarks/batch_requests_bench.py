@@ -0,0 +1,49 @@
+"""Cost per tasks/get call, individual requests vs one JSON-RPC batch.
+
+Runs A2AServer in-process over a real local HTTP connection, polling
+`--tasks` tasks the way a supervisor would.
+
+Usage: PYTHONPATH=src python benchmarks/batch_requests_bench.py [--tasks 50] [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import time
+
+from a2a.client.client import A2AClient
+from a2a.common.types import GetTaskRequest, TaskSendParams, Message, TextPart
+from bench_server import BenchTaskManager, running_server
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    task_manager = BenchTaskManager()
+    task_ids = [f"task-{i}" for i in range(args.tasks)]
+    for task_id in task_ids:
+        await task_manager.upsert_task(TaskSendParams(
+            id=task_id, message=Message(role="user", parts=[TextPart(text="hello")])
+        ))
+
+    calls = args.tasks * args.rounds
+    async with running_server(task_manager) as card, A2AClient(agent_card=card) as client:
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for task_id in task_ids:
+                await client.get_task({"id": task_id})
+        individual = (time.perf_counter() - start) / calls
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            await client.send_batch([GetTaskRequest(params={"id": task_id}) for task_id in task_ids])
+        batched = (time.perf_counter() - start) / calls
+
+    print(f"individual {individual * 1e6:9.1f}us/call")
+    print(f"batched    {batched * 1e6:9.1f}us/call ({individual / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
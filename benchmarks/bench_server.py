@@ -0,0 +1,57 @@
+"""Local A2A agent shared by the client benchmarks.
+
+Not a benchmark itself, the scripts next to it import it as they run with
+`benchmarks/` on sys.path.
+"""
+
+import asyncio
+import contextlib
+import socket
+from typing import AsyncIterator
+
+import uvicorn
+
+from a2a.common.types import AgentCard, AgentCapabilities, SendTaskResponse
+from a2a.server.server import A2AServer
+from a2a.server.task_manager import InMemoryTaskManager
+
+HOST = "127.0.0.1"
+
+
+class BenchTaskManager(InMemoryTaskManager):
+    """Stores every sent task and answers with it, streaming is left to subclasses."""
+
+    async def on_send_task(self, request):
+        task = await self.upsert_task(request.params)
+        return SendTaskResponse(id=request.id, result=self.append_task_history(task, None))
+
+    async def on_send_task_subscribe(self, request):
+        raise NotImplementedError()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def bench_agent_card(port: int, streaming: bool = False) -> AgentCard:
+    return AgentCard(name="bench", url=f"http://{HOST}:{port}/", version="1",
+                     capabilities=AgentCapabilities(streaming=streaming), skills=[])
+
+
+@contextlib.asynccontextmanager
+async def running_server(task_manager: InMemoryTaskManager) -> AsyncIterator[AgentCard]:
+    """Serves the task manager on a free local port in this event loop, yields the agent card."""
+    port = free_port()
+    card = bench_agent_card(port)
+    server = A2AServer(host=HOST, port=port, agent_card=card, task_manager=task_manager)
+    uvicorn_server = uvicorn.Server(uvicorn.Config(server.app, host=HOST, port=port, log_level="warning"))
+    serve = asyncio.create_task(uvicorn_server.serve())
+    try:
+        while not uvicorn_server.started:
+            await asyncio.sleep(0.01)
+        yield card
+    finally:
+        uvicorn_server.should_exit = True
+        await serve
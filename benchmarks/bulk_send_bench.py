@@ -0,0 +1,56 @@
+"""Throughput of submitting many tasks to one agent.
+
+Compares an unbounded asyncio.gather over A2AClient.send_task with
+A2AClient.send_tasks, individually and in JSON-RPC batches. A2AServer runs
+in-process over a real local HTTP connection.
+
+Usage: PYTHONPATH=src python benchmarks/bulk_send_bench.py [--tasks 1000] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import time
+
+from a2a.client.client import A2AClient
+from a2a.common.types import TaskSendParams, Message, TextPart
+from bench_server import BenchTaskManager, running_server
+
+
+def make_payloads(name: str, tasks: int) -> list[TaskSendParams]:
+    message = Message(role="user", parts=[TextPart(text="hello")])
+    return [TaskSendParams(id=f"{name}-{i}", message=message) for i in range(tasks)]
+
+
+async def gather_all(client: A2AClient, payloads: list[TaskSendParams]) -> int:
+    results = await asyncio.gather(*(client.send_task(payload) for payload in payloads), return_exceptions=True)
+    return sum(isinstance(result, Exception) or result.error is not None for result in results)
+
+
+async def bulk(client: A2AClient, payloads: list[TaskSendParams], concurrency: int, batch_size: int) -> int:
+    errors = 0
+    async for submission in client.send_tasks(payloads, max_concurrency=concurrency, batch_size=batch_size):
+        errors += submission.error is not None or submission.response.error is not None
+    return errors
+
+
+async def measure(name: str, run, tasks: int):
+    start = time.perf_counter()
+    errors = await run(make_payloads(name, tasks))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {tasks / elapsed:9.0f} tasks/s  errors={errors}")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    async with running_server(BenchTaskManager()) as card, A2AClient(agent_card=card) as client:
+        await measure("gather", lambda payloads: gather_all(client, payloads), args.tasks)
+        await measure("individual", lambda payloads: bulk(client, payloads, args.concurrency, 1), args.tasks)
+        await measure("batched", lambda payloads: bulk(client, payloads, args.concurrency, 20), args.tasks)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""Per-call latency of A2AClient.get_task, a client per call vs the pooled client.
+
+Runs A2AServer in-process over a real local HTTP connection. The "per call"
+path reproduces the previous `_post`, which opened a new httpx.AsyncClient, and
+so a new connection, for every JSON-RPC call.
+
+Usage: PYTHONPATH=src python benchmarks/client_latency_bench.py [--calls 2000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from a2a.client.client import A2AClient
+from a2a.common.types import GetTaskRequest, TaskSendParams, Message, TextPart
+from bench_server import BenchTaskManager, running_server
+
+
+async def client_per_call(url: str, request: GetTaskRequest):
+    async with httpx.AsyncClient() as client:
+        response = await client.post(url, json=request.model_dump(), timeout=None)
+        response.raise_for_status()
+        return response.json()
+
+
+async def measure(name: str, call, calls: int):
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"{name:<10} p50={statistics.median(latencies) * 1e6:8.1f}us  "
+          f"p99={latencies[int(len(latencies) * 0.99)] * 1e6:8.1f}us")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2_000)
+    args = parser.parse_args()
+
+    task_manager = BenchTaskManager()
+    await task_manager.upsert_task(TaskSendParams(
+        id="task-1", message=Message(role="user", parts=[TextPart(text="hello")])
+    ))
+
+    async with running_server(task_manager) as card:
+        await measure("per call", lambda: client_per_call(card.url, GetTaskRequest(params={"id": "task-1"})), args.calls)
+        async with A2AClient(agent_card=card) as client:
+            await measure("pooled", lambda: client.get_task({"id": "task-1"}), args.calls)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
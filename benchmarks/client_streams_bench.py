@@ -0,0 +1,124 @@
+"""Concurrent remote streams one client process sustains, blocking vs async SSE client.
+
+A2AServer runs in a separate process and streams `--tokens` artifact chunks
+per task, one every `--token-interval` seconds. The client process opens
+`--streams` concurrent `tasks/sendSubscribe` streams, with the previous
+synchronous httpx client and with A2AClient, and reports the wall time against
+the ideal `tokens * token_interval` and the worst event loop stall.
+
+Usage: PYTHONPATH=src python benchmarks/client_streams_bench.py [--streams 10 100 500] [--tokens 20]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+import httpx
+import uvicorn
+from httpx_sse import connect_sse
+
+from a2a.client.client import A2AClient
+from a2a.common.types import SendTaskStreamingRequest, SendTaskStreamingResponse, TaskSendParams, Message, \
+    TextPart, TaskArtifactUpdateEvent, TaskStatusUpdateEvent, TaskStatus, TaskState, Artifact
+from a2a.server.server import A2AServer
+from bench_server import BenchTaskManager, bench_agent_card, free_port
+
+
+class StreamingTaskManager(BenchTaskManager):
+    def __init__(self, tokens: int, token_interval: float):
+        super().__init__()
+        self.tokens = tokens
+        self.token_interval = token_interval
+
+    async def on_send_task_subscribe(self, request):
+        await self.upsert_task(request.params)
+        sse_event_queue = await self.setup_sse_consumer(request.params.id)
+        asyncio.create_task(self._produce(request.params.id))
+        return self.dequeue_events_for_sse(request.id, request.params.id, sse_event_queue)
+
+    async def _produce(self, task_id: str):
+        for token in range(self.tokens):
+            await asyncio.sleep(self.token_interval)
+            artifact = Artifact(parts=[TextPart(text=f"tok{token} ")], index=0, append=token > 0, lastChunk=False)
+            await self.enqueue_events_for_sse(task_id, TaskArtifactUpdateEvent(id=task_id, artifact=artifact))
+        await self.enqueue_events_for_sse(
+            task_id, TaskStatusUpdateEvent(id=task_id, status=TaskStatus(state=TaskState.COMPLETED), final=True)
+        )
+
+
+def serve(port: int, tokens: int, token_interval: float):
+    server = A2AServer(host="127.0.0.1", port=port, agent_card=bench_agent_card(port, streaming=True),
+                       task_manager=StreamingTaskManager(tokens, token_interval))
+    uvicorn.run(server.app, host="127.0.0.1", port=port, log_level="warning", backlog=4096)
+
+
+async def blocking_stream(url: str, payload: TaskSendParams):
+    """The previous A2AClient.send_task_streaming, a synchronous client in an async generator."""
+    request = SendTaskStreamingRequest(params=payload)
+    with httpx.Client(timeout=None) as client:
+        with connect_sse(client, "POST", url, json=request.model_dump()) as event_source:
+            for sse in event_source.iter_sse():
+                yield SendTaskStreamingResponse(**json.loads(sse.data))
+
+
+async def consume(stream) -> int:
+    events = 0
+    async for _ in stream:
+        events += 1
+    return events
+
+
+async def monitor_loop(stalls: list[float], interval: float = 0.01):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(time.perf_counter() - start - interval)
+
+
+async def run(name: str, open_stream, streams: int, ideal: float):
+    stalls: list[float] = [0.0]
+    monitor = asyncio.create_task(monitor_loop(stalls))
+    message = Message(role="user", parts=[TextPart(text="hello")])
+
+    start = time.perf_counter()
+    events = await asyncio.gather(*(
+        consume(open_stream(TaskSendParams(id=f"{name}-{streams}-{i}", message=message))) for i in range(streams)
+    ))
+    elapsed = time.perf_counter() - start
+    monitor.cancel()
+
+    print(f"{name:<8} streams={streams:<5} events={sum(events):<7} wall={elapsed:7.2f}s "
+          f"(ideal {ideal:.2f}s)  max loop stall={max(stalls) * 1000:8.1f}ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--token-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port, args.tokens, args.token_interval), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{port}/"
+    while True:
+        try:
+            httpx.get(url + ".well-known/agent.json")
+            break
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+
+    ideal = args.tokens * args.token_interval
+    client = A2AClient(url=url)
+    for streams in args.streams:
+        await run("blocking", lambda params: blocking_stream(url, params), streams, ideal)
+        await run("async", client.send_task_streaming, streams, ideal)
+
+    server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Throughput of concurrent per-token task updates, global lock vs striped locks.
+
+Each simulated stream issues one `update_store` per token, as
+`AgentTaskManager._run_streaming_agent` does. `--stripes 1` reproduces the
+previous single global lock.
+
+Usage: PYTHONPATH=src python benchmarks/concurrent_streams_bench.py [--streams 500] [--tokens 50]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from a2a.common.types import TaskSendParams, TaskStatus, TaskState, Message, TextPart
+from a2a.server.task_manager import InMemoryTaskManager
+from a2a.server.task_store import SQLiteTaskStore
+from bench_server import BenchTaskManager
+
+
+async def run_stream(task_manager: InMemoryTaskManager, stream_id: int, tokens: int):
+    task_id = f"task-{stream_id}"
+    await task_manager.upsert_task(TaskSendParams(
+        id=task_id, message=Message(role="user", parts=[TextPart(text="hello")])
+    ))
+    for token in range(tokens):
+        status = TaskStatus(state=TaskState.WORKING,
+                            message=Message(role="agent", parts=[TextPart(text=f"tok{token}")]))
+        await task_manager.update_store(task_id, status, None)
+
+
+async def bench(stripes: int, streams: int, tokens: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        task_manager = BenchTaskManager(
+            task_store=SQLiteTaskStore(os.path.join(tmp, "tasks.db")), lock_stripes=stripes
+        )
+        start = time.perf_counter()
+        await asyncio.gather(*(run_stream(task_manager, i, tokens) for i in range(streams)))
+        elapsed = time.perf_counter() - start
+        await task_manager.task_store.close()
+
+    updates = streams * tokens
+    print(f"stripes={stripes:<5} streams={streams:<5} updates={updates:<8} "
+          f"{elapsed:7.2f}s {updates / elapsed:10.0f} updates/s")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=500)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--stripes", type=int, nargs="+", default=[1, 256])
+    args = parser.parse_args()
+
+    for stripes in args.stripes:
+        await bench(stripes, args.streams, args.tokens)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
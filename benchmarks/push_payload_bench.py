@@ -0,0 +1,60 @@
+"""CPU per push notification, sender and receiver, for the payload encoding paths.
+
+The previous path dumped the task to a dict, hashed a json.dumps of it, let
+httpx encode it again, and had the receiver parse and re-dump the body to hash
+it. The current path encodes the task once, hashes and posts those bytes, and
+the receiver hashes the raw body. Signing is left out as it is identical.
+
+Usage: PYTHONPATH=src python benchmarks/push_payload_bench.py [--notifications 5000] [--history 20]
+"""
+
+import argparse
+import hashlib
+import json
+import time
+
+import httpx
+
+from a2a.common.types import Task, TaskStatus, TaskState, Message, TextPart
+from a2a.utils.push_notification_auth import PushNotificationAuth
+
+
+def canonical_sha256(data: dict) -> str:
+    return hashlib.sha256(PushNotificationAuth.encode_push_notification_body(data)).hexdigest()
+
+
+def legacy_path(task: Task) -> str:
+    data = task.model_dump(mode="json", exclude_none=True)
+    digest = canonical_sha256(data)
+    body = httpx.Request("POST", "http://receiver/", json=data).read()
+    assert canonical_sha256(json.loads(body)) == digest
+    return digest
+
+
+def current_path(task: Task) -> str:
+    body = task.model_dump_json(exclude_none=True).encode()
+    digest = hashlib.sha256(body).hexdigest()
+    sent = httpx.Request("POST", "http://receiver/", content=body).read()
+    assert hashlib.sha256(sent).hexdigest() == digest
+    return digest
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--notifications", type=int, default=5_000)
+    parser.add_argument("--history", type=int, default=20)
+    args = parser.parse_args()
+
+    history = [Message(role="agent", parts=[TextPart(text=f"chunk {i} " * 20)]) for i in range(args.history)]
+    task = Task(id="task-1", sessionId="session-1", status=TaskStatus(state=TaskState.WORKING), history=history)
+
+    for name, path in (("legacy", legacy_path), ("encode once", current_path)):
+        start = time.process_time()
+        for _ in range(args.notifications):
+            path(task)
+        cpu = time.process_time() - start
+        print(f"{name:<12} {cpu / args.notifications * 1e6:8.1f}us/notification")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Requests/sec and allocated bytes per tasks/send and tasks/get through the server codec.
+
+Compares the previous path (json.loads, validate_python, model_dump then
+JSONResponse) with decoding from raw bytes with validate_json and encoding
+with model_dump_json. The task manager calls are identical in both paths.
+
+Usage: PYTHONPATH=src python benchmarks/request_codec_bench.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from starlette.responses import JSONResponse
+
+from a2a.common.types import A2ARequest, SendTaskRequest, GetTaskRequest, TaskSendParams, Message, TextPart
+from a2a.server.server import A2AServer
+from bench_server import BenchTaskManager
+
+
+async def legacy_path(server: A2AServer, body: bytes) -> bytes:
+    json_rpc_request = A2ARequest.validate_python(json.loads(body))
+    result = await server._dispatch(json_rpc_request)
+    return JSONResponse(result.model_dump(exclude_none=True)).body
+
+
+async def fast_path(server: A2AServer, body: bytes) -> bytes:
+    json_rpc_request = server._request_adapter.validate_json(body)
+    result = await server._dispatch(json_rpc_request)
+    return server._json_response(result).body
+
+
+async def measure(name: str, path, server: A2AServer, bodies: list[bytes]):
+    start = time.perf_counter()
+    for body in bodies:
+        await path(server, body)
+    elapsed = time.perf_counter() - start
+
+    sample = bodies[: min(len(bodies), 1000)]
+    tracemalloc.start()
+    for body in sample:
+        await path(server, body)
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    print(f"{name:<22} {len(bodies) / elapsed:10.0f} req/s  peak={peak / 1024:8.1f}KiB  "
+          f"live_blocks/req={blocks / len(sample):6.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    server = A2AServer(task_manager=BenchTaskManager(max_history_length=20))
+    message = Message(role="user", parts=[TextPart(text="What is my balance?")])
+    send_bodies = [
+        SendTaskRequest(params=TaskSendParams(id=f"task-{i % 100}", message=message)).model_dump_json().encode()
+        for i in range(args.requests)
+    ]
+    get_bodies = [
+        GetTaskRequest(params={"id": f"task-{i % 100}", "historyLength": 10}).model_dump_json().encode()
+        for i in range(args.requests)
+    ]
+
+    for method, bodies in (("tasks/send", send_bodies), ("tasks/get", get_bodies)):
+        await measure(f"{method} legacy", legacy_path, server, bodies)
+        await measure(f"{method} fast", fast_path, server, bodies)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+"""CPU time per event when fanning a task stream out to a growing number of subscribers.
+
+Compares serializing a SendTaskStreamingResponse per subscriber (previous
+behaviour) with the serialize-once EncodedEvent frames.
+
+Usage: PYTHONPATH=src python benchmarks/sse_fanout_bench.py [--subscribers 1 10 100] [--events 2000]
+"""
+
+import argparse
+import time
+
+from a2a.common.types import SendTaskStreamingResponse, TaskStatusUpdateEvent, TaskStatus, TaskState, Message, \
+    TextPart
+from a2a.server.sse import EncodedEvent, EncodedStreamingResponse, sse_response_prefix
+
+
+def make_event(i: int) -> TaskStatusUpdateEvent:
+    message = Message(role="agent", parts=[TextPart(text=f"token {i} " * 8)])
+    return TaskStatusUpdateEvent(id="task-1", status=TaskStatus(state=TaskState.WORKING, message=message))
+
+
+def per_subscriber(events, request_ids):
+    for event in events:
+        for request_id in request_ids:
+            SendTaskStreamingResponse(id=request_id, result=event).model_dump_json(exclude_none=True).encode()
+
+
+def serialize_once(events, request_ids):
+    prefixes = [sse_response_prefix(request_id) for request_id in request_ids]
+    for event in events:
+        encoded = EncodedEvent(event)
+        for request_id, prefix in zip(request_ids, prefixes):
+            EncodedStreamingResponse(request_id, encoded, prefix).to_sse_frame()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 2, 10, 50, 100])
+    parser.add_argument("--events", type=int, default=2_000)
+    args = parser.parse_args()
+
+    events = [make_event(i) for i in range(args.events)]
+    for subscribers in args.subscribers:
+        request_ids = [f"request-{i}" for i in range(subscribers)]
+        for name, fan_out in (("per-subscriber", per_subscriber), ("serialize-once", serialize_once)):
+            start = time.process_time()
+            fan_out(events, request_ids)
+            cpu_per_event = (time.process_time() - start) / len(events) * 1e6
+            print(f"{name:<15} subscribers={subscribers:<5} {cpu_per_event:9.1f}us CPU/event")
+
+
+if __name__ == "__main__":
+    main()
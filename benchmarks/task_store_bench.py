@@ -0,0 +1,72 @@
+"""Per-operation latency of the TaskStore backends at increasing store sizes.
+
+Usage: PYTHONPATH=src python benchmarks/task_store_bench.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from a2a.common.types import Task, TaskStatus, TaskState, Message, TextPart, PushNotificationConfig
+from a2a.server.task_store import InMemoryTaskStore, SQLiteTaskStore
+
+
+def make_task(i: int) -> Task:
+    message = Message(role="user", parts=[TextPart(text=f"message {i}")])
+    return Task(id=f"task-{i}", sessionId=f"session-{i}", status=TaskStatus(state=TaskState.WORKING),
+                history=[message])
+
+
+async def timed(samples: list[float], coro):
+    start = time.perf_counter()
+    result = await coro
+    samples.append(time.perf_counter() - start)
+    return result
+
+
+def report(backend: str, size: int, op: str, samples: list[float]):
+    samples.sort()
+    p50 = statistics.median(samples) * 1e6
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1e6
+    print(f"{backend:<8} {size:>9} {op:<10} p50={p50:9.1f}us p99={p99:9.1f}us")
+
+
+async def bench(backend: str, store, size: int, ops: int):
+    for i in range(size):
+        await store.save_task(make_task(i))
+    if isinstance(store, SQLiteTaskStore):
+        store.flush()
+
+    ids = [random.randrange(size) for _ in range(ops)]
+    get_samples, update_samples, push_samples = [], [], []
+    for i in ids:
+        task = await timed(get_samples, store.get_task(f"task-{i}"))
+        task.status = TaskStatus(state=TaskState.COMPLETED)
+        await timed(update_samples, store.save_task(task))
+        await timed(push_samples, store.set_push_notification_info(
+            task.id, PushNotificationConfig(url="http://localhost/notify")))
+
+    report(backend, size, "get", get_samples)
+    report(backend, size, "update", update_samples)
+    report(backend, size, "push_set", push_samples)
+    await store.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=5_000)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        await bench("memory", InMemoryTaskStore(), size, args.ops)
+        with tempfile.TemporaryDirectory() as tmp:
+            await bench("sqlite", SQLiteTaskStore(os.path.join(tmp, "tasks.db")), size, args.ops)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
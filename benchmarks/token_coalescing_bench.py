@@ -0,0 +1,68 @@
+"""CPU and bytes saved by coalescing token chunks, against the latency it adds.
+
+A simulated agent yields `--tokens` chunks every `--token-interval` seconds.
+Every chunk left after coalescing is turned into a TaskStatusUpdateEvent and
+serialized, as `_run_streaming_agent` does for each store update and SSE event.
+
+Usage: PYTHONPATH=src python benchmarks/token_coalescing_bench.py [--tokens 1000] [--token-interval 0.002]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from a2a.common.types import TaskStatusUpdateEvent, TaskStatus, TaskState, Message, TextPart
+from a2a.server.coalescing import coalesce_working_chunks
+from a2a.server.sse import EncodedEvent
+
+TOKEN = "tok| "
+
+
+async def agent_stream(tokens: int, token_interval: float, produced_at: list[float]):
+    for _ in range(tokens):
+        await asyncio.sleep(token_interval)
+        produced_at.append(time.perf_counter())
+        yield {"is_task_complete": False, "require_user_input": False, "content": TOKEN}
+    yield {"is_task_complete": True, "require_user_input": False, "content": "done"}
+
+
+async def run(tokens: int, token_interval: float, interval: float, max_bytes: int):
+    produced_at: list[float] = []
+    latencies: list[float] = []
+    events = 0
+    payload_bytes = 0
+    consumed = 0
+    cpu = 0.0
+
+    stream = coalesce_working_chunks(agent_stream(tokens, token_interval, produced_at), interval, max_bytes)
+    async for item in stream:
+        now = time.perf_counter()
+        count = item["content"].count("|")
+        latencies.extend(now - produced for produced in produced_at[consumed:consumed + count])
+        consumed += count
+
+        start = time.process_time()
+        message = Message(role="agent", parts=[TextPart(text=item["content"])])
+        event = TaskStatusUpdateEvent(id="task-1", status=TaskStatus(state=TaskState.WORKING, message=message))
+        payload_bytes += len(EncodedEvent(event).data)
+        cpu += time.process_time() - start
+        events += 1
+
+    print(f"interval={interval * 1000:5.0f}ms max_bytes={max_bytes:<6} events={events:<6} "
+          f"bytes={payload_bytes:<9} cpu={cpu * 1000:8.1f}ms "
+          f"latency p50={statistics.median(latencies) * 1000:6.1f}ms max={max(latencies) * 1000:6.1f}ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=1_000)
+    parser.add_argument("--token-interval", type=float, default=0.002)
+    args = parser.parse_args()
+
+    for interval, max_bytes in ((0, 0), (0.02, 0), (0.05, 1024), (0.1, 4096)):
+        await run(args.tokens, args.token_interval, interval, max_bytes)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,6 @@
 import httpx
-from httpx_sse import connect_sse
-from typing import Any, AsyncIterable
+from httpx_sse import aconnect_sse
+from typing import Any, AsyncIterable, Iterable
 from a2a.common.types import (
     AgentCard,
     GetTaskRequest,
@@ -16,20 +16,86 @@ from a2a.common.types import (
     GetTaskPushNotificationResponse,
     A2AClientHTTPError,
     A2AClientJSONError,
+    A2AClientTimeoutError,
+    A2AClientCircuitOpenError,
     SendTaskStreamingRequest,
     SendTaskStreamingResponse, TaskSendParams,
+    JSONRPCResponse,
+    InternalError,
+    InvalidRequestError,
 )
+from a2a.client.resilience import RetryPolicy, CircuitBreaker, CircuitBreakerStats, get_circuit_breaker, \
+    is_retryable, is_agent_failure, DEFAULT_TIMEOUTS, IDEMPOTENT_METHODS, NOT_SENT_ERRORS
+import asyncio
 import json
 
+RESPONSE_TYPES: dict[type[JSONRPCRequest], type[JSONRPCResponse]] = {
+    SendTaskRequest: SendTaskResponse,
+    GetTaskRequest: GetTaskResponse,
+    CancelTaskRequest: CancelTaskResponse,
+    SetTaskPushNotificationRequest: SetTaskPushNotificationResponse,
+    GetTaskPushNotificationRequest: GetTaskPushNotificationResponse,
+}
+
 
 class A2AClient:
-    def __init__(self, agent_card: AgentCard = None, url: str = None):
+    """JSON-RPC client of an A2A agent.
+
+    Calls share a pool of keep-alive connections, owned by the client unless an
+    `httpx_client` is given, e.g. to share one pool between agents. An owned pool
+    is released with `close()` or by using the client as an async context manager.
+    `http2` requires the `h2` package.
+
+    Each method has its own timeout budget. Failed calls are retried with
+    jittered backoff when the request never reached the agent, or when the method
+    is idempotent. With `hedge_delay` set, a tasks/get that has not answered
+    within that delay is sent a second time and the first answer wins. Calls fail
+    fast with A2AClientCircuitOpenError while the circuit breaker of the agent
+    URL is open.
+    """
+
+    def __init__(self, agent_card: AgentCard = None, url: str = None, httpx_client: httpx.AsyncClient = None,
+                 limits: httpx.Limits = None, http2: bool = False, timeouts: dict[str, httpx.Timeout] = None,
+                 retry_policy: RetryPolicy = None, hedge_delay: float | None = None,
+                 circuit_breaker: CircuitBreaker = None):
         if agent_card:
             self.url = agent_card.url
         elif url:
             self.url = url
         else:
             raise ValueError("Must provide either agent_card or url")
+        # Every open stream holds a connection, so the pool size is not capped by default.
+        self.limits = limits or httpx.Limits(max_connections=None, max_keepalive_connections=20, keepalive_expiry=30)
+        self.http2 = http2
+        self._owns_client = httpx_client is None
+        self._client: httpx.AsyncClient | None = httpx_client
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedge_delay = hedge_delay
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(self.url)
+        # Unknown until a batch has been sent.
+        self.supports_batch: bool | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Client shared by the calls of this A2AClient, reusing its connections."""
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._client = httpx.AsyncClient(timeout=None, limits=self.limits, http2=self.http2)
+        return self._client
+
+    async def close(self):
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "A2AClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def get_circuit_stats(self) -> CircuitBreakerStats:
+        return self.circuit_breaker.get_stats()
 
     async def send_task(self, payload: TaskSendParams) -> SendTaskResponse:
         request = SendTaskRequest(params=payload)
@@ -39,31 +105,111 @@ class A2AClient:
         self, payload: TaskSendParams
     ) -> AsyncIterable[SendTaskStreamingResponse]:
         request = SendTaskStreamingRequest(params=payload)
-        with httpx.Client(timeout=None) as client:
-            with connect_sse(
-                client, "POST", self.url, json=request.model_dump()
-            ) as event_source:
-                try:
-                    for sse in event_source.iter_sse():
-                        yield SendTaskStreamingResponse(**json.loads(sse.data))
-                except json.JSONDecodeError as e:
-                    raise A2AClientJSONError(str(e)) from e
-                except httpx.RequestError as e:
+        attempt = 0
+        while True:
+            self._check_circuit()
+            try:
+                async with aconnect_sse(
+                    self.client, "POST", self.url, json=request.model_dump(), timeout=self.timeouts[request.method]
+                ) as event_source:
+                    # aconnect_sse only checks the content type, an error status is reported as such.
+                    try:
+                        event_source.response.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        if is_agent_failure(e):
+                            self.circuit_breaker.record_failure()
+                        else:
+                            self.circuit_breaker.record_success()
+                        raise self._to_client_error(e) from e
+                    self.circuit_breaker.record_success()
+                    try:
+                        async for sse in event_source.aiter_sse():
+                            yield SendTaskStreamingResponse(**json.loads(sse.data))
+                    except json.JSONDecodeError as e:
+                        raise A2AClientJSONError(str(e)) from e
+                    except httpx.TimeoutException as e:
+                        raise A2AClientTimeoutError(str(e)) from e
+                    except httpx.RequestError as e:
+                        self.circuit_breaker.record_failure()
+                        raise A2AClientHTTPError(400, str(e)) from e
+                return
+            except NOT_SENT_ERRORS as e:
+                # Only opening the stream is retried, events may have been consumed afterwards.
+                self.circuit_breaker.record_failure()
+                attempt += 1
+                if attempt >= self.retry_policy.max_attempts:
                     raise A2AClientHTTPError(400, str(e)) from e
+                await asyncio.sleep(self.retry_policy.delay(attempt))
 
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
+        return await self._call(
+            request.model_dump(),
+            self.timeouts.get(request.method),
+            idempotent=request.method in IDEMPOTENT_METHODS,
+            hedge=request.method == "tasks/get",
+        )
+
+    def _check_circuit(self):
+        if not self.circuit_breaker.allow_request():
+            raise A2AClientCircuitOpenError(self.url)
+
+    async def _call(self, payload: Any, timeout: httpx.Timeout | None, idempotent: bool, hedge: bool = False) -> Any:
+        attempt = 0
+        while True:
+            self._check_circuit()
             try:
-                # Image generation could take time, adding timeout
-                response = await client.post(
-                    self.url, json=request.model_dump(), timeout=None
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                raise A2AClientHTTPError(e.response.status_code, str(e)) from e
-            except json.JSONDecodeError as e:
-                raise A2AClientJSONError(str(e)) from e
+                if hedge and self.hedge_delay is not None:
+                    result = await self._hedged_post(payload, timeout)
+                else:
+                    result = await self._post(payload, timeout)
+            except Exception as e:
+                if is_agent_failure(e):
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+
+                attempt += 1
+                if attempt >= self.retry_policy.max_attempts or not is_retryable(idempotent, e):
+                    raise self._to_client_error(e) from e
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+                continue
+
+            self.circuit_breaker.record_success()
+            return result
+
+    async def _hedged_post(self, payload: Any, timeout: httpx.Timeout | None) -> Any:
+        attempts = {asyncio.create_task(self._post(payload, timeout))}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self.hedge_delay)
+            if not done:
+                attempts.add(asyncio.create_task(self._post(payload, timeout)))
+
+            pending = attempts
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None or not pending:
+                        return attempt.result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def _post(self, payload: Any, timeout: httpx.Timeout | None) -> Any:
+        response = await self.client.post(
+            self.url, json=payload, timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _to_client_error(error: Exception) -> Exception:
+        if isinstance(error, httpx.HTTPStatusError):
+            return A2AClientHTTPError(error.response.status_code, str(error))
+        if isinstance(error, httpx.TimeoutException):
+            return A2AClientTimeoutError(str(error))
+        if isinstance(error, json.JSONDecodeError):
+            return A2AClientJSONError(str(error))
+        return error
 
     async def get_task(self, payload: dict[str, Any]) -> GetTaskResponse:
         request = GetTaskRequest(params=payload)
@@ -83,4 +229,121 @@ class A2AClient:
         self, payload: dict[str, Any]
     ) -> GetTaskPushNotificationResponse:
         request = GetTaskPushNotificationRequest(params=payload)
-        return GetTaskPushNotificationResponse(**await self._send_request(request))
\ No newline at end of file
+        return GetTaskPushNotificationResponse(**await self._send_request(request))
+
+    async def send_batch(self, requests: list[JSONRPCRequest]) -> list[JSONRPCResponse]:
+        """Sends non-streaming requests as one JSON-RPC batch.
+
+        Responses are returned in the order of the requests.
+        """
+        if len(requests) == 0:
+            return []
+
+        # The batch is answered once every request is processed, it gets the largest budget.
+        timeout = max(
+            (self.timeouts.get(request.method) for request in requests),
+            key=lambda t: float("inf") if t is None or t.read is None else t.read,
+        )
+        try:
+            body = await self._call(
+                [request.model_dump() for request in requests],
+                timeout,
+                idempotent=all(request.method in IDEMPOTENT_METHODS for request in requests),
+            )
+        except A2AClientHTTPError as e:
+            if self._is_batch_rejection(e.__cause__):
+                self.supports_batch = False
+            raise
+        if not isinstance(body, list):
+            # Servers without batch support answer the array with a single error response.
+            self.supports_batch = False
+            raise A2AClientJSONError(f"Expected a batch response, received: {body}")
+        self.supports_batch = True
+
+        responses_by_id = {item.get("id"): item for item in body}
+        responses = []
+        for request in requests:
+            item = responses_by_id.get(request.id)
+            if item is None:
+                responses.append(JSONRPCResponse(id=request.id, error=InternalError(message="Missing batch response")))
+            else:
+                responses.append(RESPONSE_TYPES.get(type(request), JSONRPCResponse)(**item))
+        return responses
+
+    @staticmethod
+    def _is_batch_rejection(error: BaseException | None) -> bool:
+        """True for the answer of a server without batch support, which rejects the array as an invalid request."""
+        if not isinstance(error, httpx.HTTPStatusError) or error.response.status_code != 400:
+            return False
+        try:
+            body = error.response.json()
+        except json.JSONDecodeError:
+            return False
+        return isinstance(body, dict) and (body.get("error") or {}).get("code") == InvalidRequestError().code
+
+    async def send_tasks(
+        self, payloads: Iterable[TaskSendParams], max_concurrency: int = 8, batch_size: int = 10
+    ) -> AsyncIterable["TaskSubmission"]:
+        """Sends many tasks, yielding each submission as soon as it is answered.
+
+        Tasks are grouped `batch_size` at a time into JSON-RPC batches, and at
+        most `max_concurrency` groups are in flight. Individual requests are sent
+        instead when `batch_size` is 1 or the server does not support batches.
+        A failed task is yielded with its error and does not stop the others.
+        """
+        if max_concurrency < 1 or batch_size < 1:
+            raise ValueError("max_concurrency and batch_size must be at least 1")
+
+        payloads = list(payloads)
+        groups = [
+            list(range(start, min(start + batch_size, len(payloads))))
+            for start in range(0, len(payloads), batch_size)
+        ]
+        limit = asyncio.Semaphore(max_concurrency)
+
+        async def submit(indexes: list[int]) -> list[TaskSubmission]:
+            async with limit:
+                if len(indexes) > 1 and self.supports_batch is not False:
+                    requests = [SendTaskRequest(params=payloads[index]) for index in indexes]
+                    try:
+                        responses = await self.send_batch(requests)
+                        return [
+                            TaskSubmission(index, payloads[index], response=response)
+                            for index, response in zip(indexes, responses)
+                        ]
+                    except Exception as e:
+                        if self.supports_batch is not False:
+                            return [TaskSubmission(index, payloads[index], error=e) for index in indexes]
+
+                submissions = []
+                for index in indexes:
+                    try:
+                        response = await self.send_task(payloads[index])
+                        submissions.append(TaskSubmission(index, payloads[index], response=response))
+                    except Exception as e:
+                        submissions.append(TaskSubmission(index, payloads[index], error=e))
+                return submissions
+
+        pending = [asyncio.create_task(submit(indexes)) for indexes in groups]
+        try:
+            for submitted in asyncio.as_completed(pending):
+                for submission in await submitted:
+                    yield submission
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class TaskSubmission:
+    """Outcome of one task of `A2AClient.send_tasks`, `index` is its position in the payloads.
+
+    `error` is set when no response was received, a JSON-RPC error is carried by the response.
+    """
+    __slots__ = ("index", "params", "response", "error")
+
+    def __init__(self, index: int, params: TaskSendParams, response: SendTaskResponse | None = None,
+                 error: Exception | None = None):
+        self.index = index
+        self.params = params
+        self.response = response
+        self.error = error
@@ -0,0 +1,127 @@
+import random
+import time
+from enum import Enum
+
+import httpx
+from pydantic import BaseModel
+
+# Methods whose repeated call leaves the agent in the same state, safe to retry
+# even when the first attempt may have reached the agent.
+IDEMPOTENT_METHODS = frozenset({
+    "tasks/get",
+    "tasks/cancel",
+    "tasks/pushNotification/set",
+    "tasks/pushNotification/get",
+})
+
+# Errors raised before the request was sent, any method can be retried after them.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+
+DEFAULT_TIMEOUTS: dict[str, httpx.Timeout] = {
+    # Agents may take long to answer, e.g. for image generation.
+    "tasks/send": httpx.Timeout(300.0, connect=10.0),
+    # Bounds the wait between two streamed events, not the whole stream.
+    "tasks/sendSubscribe": httpx.Timeout(300.0, connect=10.0),
+    "tasks/resubscribe": httpx.Timeout(300.0, connect=10.0),
+    "tasks/get": httpx.Timeout(10.0),
+    "tasks/cancel": httpx.Timeout(30.0),
+    "tasks/pushNotification/set": httpx.Timeout(30.0),
+    "tasks/pushNotification/get": httpx.Timeout(10.0),
+}
+
+
+class RetryPolicy(BaseModel):
+    """Retries with exponential backoff and full jitter."""
+    max_attempts: int = 3
+    backoff: float = 0.2
+    max_backoff: float = 5.0
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff * 2 ** attempt, self.max_backoff))
+
+
+def is_retryable(idempotent: bool, error: Exception) -> bool:
+    if isinstance(error, NOT_SENT_ERRORS):
+        return True
+    if not idempotent:
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def is_agent_failure(error: Exception) -> bool:
+    """Failures counted by the circuit breaker, client errors do not reflect the agent's health."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreakerStats(BaseModel):
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened: int = 0
+    rejected: int = 0
+
+
+class CircuitBreaker:
+    """Fails fast once an agent has failed `failure_threshold` times in a row.
+
+    After `reset_timeout` seconds a single probe call is let through, its
+    outcome closes the circuit or opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stats = CircuitBreakerStats()
+        self.opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        return self.stats.state
+
+    def allow_request(self) -> bool:
+        if self.stats.state == CircuitState.CLOSED:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at >= self.reset_timeout:
+            # Lets a single probe through, another one only if it never completes.
+            self.stats.state = CircuitState.HALF_OPEN
+            self.opened_at = now
+            return True
+        self.stats.rejected += 1
+        return False
+
+    def record_success(self):
+        self.stats.state = CircuitState.CLOSED
+        self.stats.consecutive_failures = 0
+
+    def record_failure(self):
+        self.stats.consecutive_failures += 1
+        if self.stats.state == CircuitState.HALF_OPEN or self.stats.consecutive_failures >= self.failure_threshold:
+            if self.stats.state != CircuitState.OPEN:
+                self.stats.opened += 1
+            self.stats.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> CircuitBreakerStats:
+        return self.stats.model_copy()
+
+
+# Breakers are shared by every client of the same agent URL.
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(url: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> CircuitBreaker:
+    if url not in _circuit_breakers:
+        _circuit_breakers[url] = CircuitBreaker(failure_threshold, reset_timeout)
+    return _circuit_breakers[url]
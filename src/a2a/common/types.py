@@ -302,6 +302,10 @@ class ContentTypeNotSupportedError(JSONRPCError):
     data: None = None
 
 
+class SlowConsumerError(InternalError):
+    message: str = "Subscriber is too slow, stream disconnected"
+
+
 class AgentProvider(BaseModel):
     organization: str
     url: str | None = None
@@ -359,6 +363,18 @@ class A2AClientJSONError(A2AClientError):
         super().__init__(f"JSON Error: {message}")
 
 
+class A2AClientTimeoutError(A2AClientError):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(f"Timeout Error: {message}")
+
+
+class A2AClientCircuitOpenError(A2AClientError):
+    def __init__(self, url: str):
+        self.url = url
+        super().__init__(f"Circuit open for agent {url}")
+
+
 class MissingAPIKeyError(Exception):
     """Exception for missing API key."""
 
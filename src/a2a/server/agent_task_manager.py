@@ -7,6 +7,9 @@ from a2a.common.common import are_modalities_compatible, new_incompatible_types_
 from a2a.server.base_agent import BaseAgent
 from a2a.server.server import logger
 from a2a.server.task_manager import InMemoryTaskManager
+from a2a.server.task_store import TaskStore
+from a2a.server.coalescing import coalesce_working_chunks
+from a2a.server.push_notifications import PushNotificationQueue, PushDeliveryStats
 from a2a.common.types import SendTaskStreamingRequest, TaskSendParams, TaskState, Message, Artifact, TaskStatus, \
     TaskArtifactUpdateEvent, TaskStatusUpdateEvent, InternalError, SendTaskRequest, JSONRPCResponse, InvalidParamsError, \
     SendTaskResponse, SendTaskStreamingResponse, TextPart, Task, TaskIdParams, PushNotificationConfig
@@ -15,17 +18,34 @@ from agent_handoff.agent import HandoffAgent
 
 
 class AgentTaskManager(InMemoryTaskManager):
-    def __init__(self, agent: BaseAgent, notification_sender_auth: PushNotificationSenderAuth):
-        super().__init__()
+    def __init__(self, agent: BaseAgent, notification_sender_auth: PushNotificationSenderAuth,
+                 task_store: TaskStore = None, coalesce_interval: float = 0.05, coalesce_max_bytes: int = 1024,
+                 push_notification_queue: PushNotificationQueue = None, **kwargs):
+        # Other keyword arguments configure InMemoryTaskManager, e.g. event_stream,
+        # retention_policy or slow_consumer_policy.
+        super().__init__(task_store=task_store, **kwargs)
         self.agent : BaseAgent = agent
         self.notification_sender_auth = notification_sender_auth
+        # Notifications are delivered in the background so a slow webhook never stalls the agent.
+        self.push_notification_queue = push_notification_queue or PushNotificationQueue(notification_sender_auth)
+        # Window merging consecutive WORKING chunks into one store update and SSE event.
+        self.coalesce_interval = coalesce_interval
+        self.coalesce_max_bytes = coalesce_max_bytes
 
     async def _run_streaming_agent(self, request: SendTaskStreamingRequest):
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
 
         try:
-            async for item in self.agent.async_stream(query, task_send_params.sessionId):
+            agent_stream = coalesce_working_chunks(
+                self.agent.async_stream(query, task_send_params.sessionId),
+                self.coalesce_interval,
+                self.coalesce_max_bytes,
+            )
+            # Streamed output grows a single artifact, subscribers only receive the new chunks.
+            streaming_artifact = False
+            previous_state = None
+            async for item in agent_stream:
                 is_task_complete = item["is_task_complete"]
                 require_user_input = item["require_user_input"]
                 artifact = None
@@ -35,14 +55,17 @@ class AgentTaskManager(InMemoryTaskManager):
 
                 if not is_task_complete and not require_user_input:
                     task_state = TaskState.WORKING
-                    message = Message(role="agent", parts=parts)
+                    artifact = Artifact(parts=parts, index=0, append=streaming_artifact, lastChunk=False)
+                    streaming_artifact = True
                 elif require_user_input:
                     task_state = TaskState.INPUT_REQUIRED
                     message = Message(role="agent", parts=parts)
+                    if streaming_artifact:
+                        artifact = Artifact(parts=[], index=0, append=True, lastChunk=True)
                     end_stream = True
                 else:
                     task_state = TaskState.COMPLETED
-                    artifact = Artifact(parts=parts, index=0, append=False)
+                    artifact = Artifact(parts=parts, index=0, append=False, lastChunk=True)
                     end_stream = True
 
                 task_status = TaskStatus(state=task_state, message=message)
@@ -62,13 +85,15 @@ class AgentTaskManager(InMemoryTaskManager):
                         task_send_params.id, task_artifact_update_event
                     )
 
-                task_update_event = TaskStatusUpdateEvent(
-                    id=task_send_params.id, status=task_status, final=end_stream
-                )
+                if task_state != previous_state or end_stream:
+                    task_update_event = TaskStatusUpdateEvent(
+                        id=task_send_params.id, status=task_status, final=end_stream
+                    )
 
-                await self.enqueue_events_for_sse(
-                    task_send_params.id, task_update_event
-                )
+                    await self.enqueue_events_for_sse(
+                        task_send_params.id, task_update_event
+                    )
+                previous_state = task_state
 
         except Exception as e:
             logger.error(f"An error occurred while streaming the response: {e}")
@@ -76,6 +101,15 @@ class AgentTaskManager(InMemoryTaskManager):
                 task_send_params.id,
                 InternalError(message=f"An error occurred while streaming the response: {e}")
             )
+            # Also ends the streams followed from other workers, which do not receive errors.
+            task_status = TaskStatus(state=TaskState.FAILED)
+            try:
+                await self.update_store(task_send_params.id, task_status, None)
+            except ValueError:
+                pass
+            await self.enqueue_events_for_sse(
+                task_send_params.id, TaskStatusUpdateEvent(id=task_send_params.id, status=task_status, final=True)
+            )
 
     def _validate_request(
             self, request: Union[SendTaskRequest, SendTaskStreamingRequest]
@@ -116,8 +150,18 @@ class AgentTaskManager(InMemoryTaskManager):
 
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
+        agent_run = asyncio.create_task(self.agent.async_invoke(query, task_send_params.sessionId))
+        self.register_running_agent(task_send_params.id, agent_run)
         try:
-            agent_response = await self.agent.async_invoke(query, task_send_params.sessionId)
+            agent_response = await agent_run
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            # The agent run was interrupted by tasks/cancel, which moves the stored task to CANCELED.
+            task = await self.task_store.get_task(task_send_params.id)
+            task_result = self.append_task_history(task, task_send_params.historyLength)
+            task_result.status = TaskStatus(state=TaskState.CANCELED)
+            return SendTaskResponse(id=request.id, result=task_result)
         except Exception as e:
             logger.error(f"Error invoking agent: {e}")
             raise ValueError(f"Error invoking agent: {e}")
@@ -143,7 +187,9 @@ class AgentTaskManager(InMemoryTaskManager):
             task_send_params: TaskSendParams = request.params
             sse_event_queue = await self.setup_sse_consumer(task_send_params.id, False)
 
-            asyncio.create_task(self._run_streaming_agent(request))
+            self.register_running_agent(
+                task_send_params.id, asyncio.create_task(self._run_streaming_agent(request))
+            )
 
             return self.dequeue_events_for_sse(
                 request.id, task_send_params.id, sse_event_queue
@@ -197,17 +243,23 @@ class AgentTaskManager(InMemoryTaskManager):
         push_info = await self.get_push_notification_info(task.id)
 
         logger.info(f"Notifying for task {task.id} => {task.status.state}")
-        await self.notification_sender_auth.send_push_notification(
-            push_info.url,
-            data=task.model_dump(exclude_none=True)
-        )
+        self.push_notification_queue.enqueue(push_info.url, task)
+
+    def get_push_notification_stats(self) -> PushDeliveryStats:
+        return self.push_notification_queue.get_stats()
+
+    async def close(self):
+        await self.push_notification_queue.close()
+        await super().close()
 
     async def on_resubscribe_to_task(
             self, request
     ) -> AsyncIterable[SendTaskStreamingResponse] | JSONRPCResponse:
         task_id_params: TaskIdParams = request.params
         try:
-            sse_event_queue = await self.setup_sse_consumer(task_id_params.id, True)
+            sse_event_queue = await self.setup_sse_consumer(
+                task_id_params.id, True, self.get_last_event_id(task_id_params)
+            )
             return self.dequeue_events_for_sse(request.id, task_id_params.id, sse_event_queue)
         except Exception as e:
             logger.error(f"Error while reconnecting to SSE stream: {e}")
@@ -0,0 +1,79 @@
+import asyncio
+from typing import AsyncIterable, Any, Dict
+
+
+def is_working_chunk(item: Dict[str, Any]) -> bool:
+    return not item["is_task_complete"] and not item["require_user_input"]
+
+
+async def coalesce_working_chunks(
+        stream: AsyncIterable[Dict[str, Any]], interval: float, max_bytes: int
+) -> AsyncIterable[Dict[str, Any]]:
+    """Merges consecutive WORKING chunks of an agent stream.
+
+    Merged content is released once `interval` seconds have passed since its first
+    chunk or once it holds `max_bytes` characters, whichever comes first; a limit
+    <= 0 is disabled. Any other item flushes the pending content and is yielded
+    right away, final and input-required items are never delayed.
+    """
+    if interval <= 0 and max_bytes <= 0:
+        async for item in stream:
+            yield item
+        return
+
+    # The stream is consumed by a separate task so the time window can expire
+    # while the agent is idle, without cancelling the agent's generator.
+    queue: asyncio.Queue = asyncio.Queue()
+    end_of_stream = object()
+
+    async def pump():
+        try:
+            async for item in stream:
+                await queue.put(item)
+            await queue.put(end_of_stream)
+        except Exception as e:
+            await queue.put(e)
+
+    loop = asyncio.get_running_loop()
+    pump_task = asyncio.create_task(pump())
+    pending = None
+    deadline = None
+    try:
+        while True:
+            timeout = None
+            if pending is not None and interval > 0:
+                timeout = max(deadline - loop.time(), 0)
+
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield pending
+                pending = None
+                continue
+
+            if item is end_of_stream:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            if is_working_chunk(item):
+                if pending is None:
+                    pending = dict(item)
+                    deadline = loop.time() + interval
+                else:
+                    pending["content"] += item["content"]
+
+                if 0 < max_bytes <= len(pending["content"]):
+                    yield pending
+                    pending = None
+                continue
+
+            if pending is not None:
+                yield pending
+                pending = None
+            yield item
+
+        if pending is not None:
+            yield pending
+    finally:
+        pump_task.cancel()
@@ -0,0 +1,75 @@
+import time
+from typing import Any, Awaitable, Callable, Union, Annotated
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from a2a.common.types import JSONRPCRequest, JSONRPCResponse
+
+MethodHandler = Callable[[JSONRPCRequest], Awaitable[Any]]
+# Returning a response from a pre hook short-circuits the call, e.g. to reject it.
+PreHook = Callable[[JSONRPCRequest], Awaitable[JSONRPCResponse | None]]
+PostHook = Callable[[JSONRPCRequest, Any], Awaitable[None]]
+
+
+class MethodStats(BaseModel):
+    calls: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.calls if self.calls else 0.0
+
+
+class MethodRoute:
+    """Handler of a JSON-RPC method with its hooks and counters.
+
+    For streaming methods the latency covers the call returning the stream, not
+    the stream itself.
+    """
+
+    def __init__(self, request_type: type[JSONRPCRequest], handler: MethodHandler, streaming: bool = False):
+        self.request_type = request_type
+        self.handler = handler
+        self.streaming = streaming
+        self.pre_hooks: list[PreHook] = []
+        self.post_hooks: list[PostHook] = []
+        self.stats = MethodStats()
+
+    async def __call__(self, request: JSONRPCRequest) -> Any:
+        start = time.perf_counter()
+        try:
+            for hook in self.pre_hooks:
+                response = await hook(request)
+                if response is not None:
+                    result = response
+                    break
+            else:
+                result = await self.handler(request)
+
+            for hook in self.post_hooks:
+                await hook(request, result)
+        except Exception:
+            self.stats.errors += 1
+            raise
+        finally:
+            latency = time.perf_counter() - start
+            self.stats.calls += 1
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+
+        if isinstance(result, JSONRPCResponse) and result.error is not None:
+            self.stats.errors += 1
+        return result
+
+
+def method_name(request_type: type[JSONRPCRequest]) -> str:
+    return request_type.model_fields["method"].default
+
+
+def build_request_adapter(request_types: list[type[JSONRPCRequest]]) -> TypeAdapter:
+    """Validates any of the registered request types, selected by their `method` literal."""
+    if len(request_types) == 1:
+        return TypeAdapter(request_types[0])
+    return TypeAdapter(Annotated[Union[tuple(request_types)], Field(discriminator="method")])
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+
+from a2a.common.types import TaskStatusUpdateEvent, TaskArtifactUpdateEvent
+from a2a.server.sse import EncodedEvent
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TaskEventStream(ABC):
+    """Task events shared between the server workers.
+
+    The worker running the agent of a task appends its sequence-numbered events,
+    the other workers read them to serve their own subscribers.
+    """
+
+    @abstractmethod
+    async def append(self, task_id: str, event: EncodedEvent):
+        pass
+
+    @abstractmethod
+    async def read_after(self, task_id: str, seq: int) -> list[EncodedEvent]:
+        pass
+
+    @abstractmethod
+    async def last_seq(self, task_id: str) -> int:
+        pass
+
+    @abstractmethod
+    async def delete_task(self, task_id: str):
+        pass
+
+    async def close(self):
+        pass
+
+
+class SQLiteTaskEventStream(TaskEventStream):
+    """Local stand-in for a shared event bus, backed by a SQLite database in WAL mode.
+
+    Every worker process opens its own connection on first use. Only the last
+    `max_events` events of each task are kept.
+    """
+
+    def __init__(self, path: str, max_events: int = 256):
+        self.path = path
+        self.max_events = max_events
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._db_lock = threading.Lock()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared with forked worker processes.
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS task_events ("
+                "task_id TEXT NOT NULL, seq INTEGER NOT NULL, kind TEXT NOT NULL, data BLOB NOT NULL, "
+                "PRIMARY KEY (task_id, seq))"
+            )
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _append(self, task_id: str, seq: int, kind: str, data: bytes):
+        with self._db_lock:
+            conn = self._connection
+            conn.execute(
+                "INSERT OR REPLACE INTO task_events (task_id, seq, kind, data) VALUES (?, ?, ?, ?)",
+                (task_id, seq, kind, data),
+            )
+            if seq > self.max_events:
+                conn.execute(
+                    "DELETE FROM task_events WHERE task_id = ? AND seq <= ?", (task_id, seq - self.max_events)
+                )
+
+    def _query(self, query: str, args: tuple):
+        with self._db_lock:
+            return self._connection.execute(query, args).fetchall()
+
+    async def append(self, task_id: str, event: EncodedEvent):
+        kind = "status" if isinstance(event.event, TaskStatusUpdateEvent) else "artifact"
+        await asyncio.to_thread(self._append, task_id, event.seq, kind, event.data)
+
+    async def read_after(self, task_id: str, seq: int) -> list[EncodedEvent]:
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT seq, kind, data FROM task_events WHERE task_id = ? AND seq > ? ORDER BY seq",
+            (task_id, seq),
+        )
+        events = []
+        for row_seq, kind, data in rows:
+            model = TaskStatusUpdateEvent if kind == "status" else TaskArtifactUpdateEvent
+            event = EncodedEvent(model.model_validate_json(data), data=data)
+            event.seq = row_seq
+            events.append(event)
+        return events
+
+    async def last_seq(self, task_id: str) -> int:
+        rows = await asyncio.to_thread(
+            self._query, "SELECT MAX(seq) FROM task_events WHERE task_id = ?", (task_id,)
+        )
+        return rows[0][0] or 0
+
+    async def delete_task(self, task_id: str):
+        await asyncio.to_thread(self._query, "DELETE FROM task_events WHERE task_id = ?", (task_id,))
+
+    async def close(self):
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
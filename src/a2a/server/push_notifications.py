@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel
+
+from a2a.common.types import Task
+from a2a.utils.push_notification_auth import PushNotificationSenderAuth
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying, other client errors are permanent.
+RETRYABLE_STATUS_CODES = (408, 425, 429)
+
+
+class PushDeliveryStats(BaseModel):
+    queued: int = 0
+    coalesced: int = 0  # pending notifications replaced by a newer state of the same task
+    delivered: int = 0
+    retried: int = 0
+    failed: int = 0
+    queue_depth: int = 0
+    total_latency: float = 0.0  # from queuing the oldest pending state to its delivery
+    max_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.delivered if self.delivered else 0.0
+
+
+class PendingNotification:
+    __slots__ = ("url", "body", "queued_at")
+
+    def __init__(self, url: str, body: bytes, queued_at: float):
+        self.url = url
+        self.body = body
+        self.queued_at = queued_at
+
+
+class PushNotificationQueue:
+    """Delivers push notifications in the background.
+
+    Only the latest state of a task waits in the queue, a newer notification
+    replaces the pending one, and a task has at most one delivery in flight so
+    webhooks receive its states in order. Deliveries to the same host are
+    limited to `max_per_destination` at a time and failed deliveries are
+    retried with exponential backoff unless a newer state is already pending.
+    """
+
+    def __init__(self, sender_auth: PushNotificationSenderAuth, workers: int = 8, max_per_destination: int = 4,
+                 max_retries: int = 3, retry_backoff: float = 0.5, max_retry_backoff: float = 10.0):
+        self.sender_auth = sender_auth
+        self.workers = workers
+        self.max_per_destination = max_per_destination
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.pending: dict[str, PendingNotification] = {}
+        self.in_flight: set[str] = set()
+        self.ready: asyncio.Queue[str] = asyncio.Queue()
+        self.destination_limits: dict[str, asyncio.Semaphore] = {}
+        self.stats = PushDeliveryStats()
+        self._workers: list[asyncio.Task] = []
+
+    def enqueue(self, url: str, task: Task):
+        """Queues the current state of the task for delivery without waiting for it."""
+        self._start_workers()
+        self.stats.queued += 1
+        # Snapshot now, the stored task keeps changing while the notification waits. These
+        # bytes are signed and posted as they are, retries included.
+        body = task.model_dump_json(exclude_none=True).encode()
+        pending = self.pending.get(task.id)
+        if pending is not None:
+            self.stats.coalesced += 1
+            pending.url = url
+            pending.body = body
+            return
+
+        self.pending[task.id] = PendingNotification(url, body, time.monotonic())
+        if task.id not in self.in_flight:
+            self.ready.put_nowait(task.id)
+
+    def get_stats(self) -> PushDeliveryStats:
+        return self.stats.model_copy(update={"queue_depth": len(self.pending)})
+
+    async def join(self):
+        """Waits until every queued notification has been delivered or has failed."""
+        await self.ready.join()
+
+    async def close(self, timeout: float = 10.0):
+        """Delivers the queued notifications for up to `timeout` seconds, then stops the workers."""
+        if self._workers:
+            try:
+                await asyncio.wait_for(self.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        undelivered = self.pending.keys() | self.in_flight
+        if undelivered:
+            self.stats.failed += len(undelivered)
+            logger.warning(f"Dropping undelivered push-notifications of {len(undelivered)} tasks at shutdown")
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self.pending.clear()
+        await self.sender_auth.close()
+
+    def _start_workers(self):
+        if self._workers:
+            return
+        self._workers = [asyncio.create_task(self._run_worker()) for _ in range(self.workers)]
+
+    async def _run_worker(self):
+        while True:
+            task_id = await self.ready.get()
+            try:
+                notification = self.pending.pop(task_id, None)
+                if notification is not None:
+                    self.in_flight.add(task_id)
+                    try:
+                        await self._deliver(task_id, notification)
+                    finally:
+                        self.in_flight.discard(task_id)
+                        if task_id in self.pending:
+                            self.ready.put_nowait(task_id)
+            except Exception as e:
+                logger.error(f"Error while delivering push-notification for task {task_id}: {e}")
+            finally:
+                self.ready.task_done()
+
+    async def _deliver(self, task_id: str, notification: PendingNotification):
+        destination = urlsplit(notification.url).netloc
+        limit = self.destination_limits.setdefault(destination, asyncio.Semaphore(self.max_per_destination))
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with limit:
+                    await self.sender_auth.deliver_push_notification(notification.url, notification.body)
+            except httpx.HTTPError as e:
+                if not self._is_retryable(e) or attempt == self.max_retries:
+                    self.stats.failed += 1
+                    logger.warning(f"Error during sending push-notification for URL {notification.url}: {e}")
+                    return
+                if task_id in self.pending:
+                    # A newer state supersedes the one that failed.
+                    return
+
+                self.stats.retried += 1
+                await asyncio.sleep(min(self.retry_backoff * 2 ** attempt, self.max_retry_backoff))
+                if task_id in self.pending:
+                    return
+                continue
+
+            latency = time.monotonic() - notification.queued_at
+            self.stats.delivered += 1
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+            return
+
+    @staticmethod
+    def _is_retryable(error: httpx.HTTPError) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code >= 500 or status_code in RETRYABLE_STATUS_CODES
+        return True
@@ -0,0 +1,57 @@
+from pydantic import BaseModel
+
+from a2a.common.types import Artifact, Message, Part, TaskState, TextPart, FilePart, DataPart
+
+TERMINAL_TASK_STATES = (TaskState.COMPLETED, TaskState.CANCELED, TaskState.FAILED)
+
+
+class RetentionPolicy(BaseModel):
+    """Limits applied to tasks once they have reached a terminal state.
+
+    Tasks which are still running are never evicted, limits are enforced by
+    evicting finished tasks in the order they finished. Tasks left in the task
+    store by an earlier process are loaded when the sweeper starts. Their finish
+    time is unknown, so they count as finished at that point and are evicted
+    first. With a store shared by several workers, each worker only evicts the
+    tasks it has loaded or updated.
+    """
+    max_tasks: int | None = None
+    max_finished_age: float | None = None  # seconds since reaching a terminal state
+    max_history_bytes: int | None = None  # history and artifacts of the retained tasks
+    sweep_interval: float = 30.0
+
+
+class RetentionStats(BaseModel):
+    tasks: int = 0
+    finished_tasks: int = 0
+    history_bytes: int = 0
+    sse_subscribed_tasks: int = 0
+    evicted_by_count: int = 0
+    evicted_by_age: int = 0
+    evicted_by_history_bytes: int = 0
+
+
+def message_size(message: Message | None) -> int:
+    """Approximate the payload size of a message without serializing it."""
+    if message is None:
+        return 0
+    return parts_size(message.parts)
+
+
+def artifacts_size(artifacts: list[Artifact] | None) -> int:
+    """Approximate the payload size of the artifacts of a task."""
+    if not artifacts:
+        return 0
+    return sum(parts_size(artifact.parts) for artifact in artifacts)
+
+
+def parts_size(parts: list[Part]) -> int:
+    size = 0
+    for part in parts:
+        if isinstance(part, TextPart):
+            size += len(part.text)
+        elif isinstance(part, FilePart):
+            size += len(part.file.bytes or part.file.uri or "")
+        elif isinstance(part, DataPart):
+            size += len(str(part.data))
+    return size
@@ -1,9 +1,8 @@
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from sse_starlette.sse import EventSourceResponse
 from starlette.requests import Request
 from a2a.common.types import (
-    A2ARequest,
     JSONRPCResponse,
     InvalidRequestError,
     JSONParseError,
@@ -16,18 +15,35 @@ from a2a.common.types import (
     AgentCard,
     TaskResubscriptionRequest,
     SendTaskStreamingRequest,
+    JSONRPCRequest,
+    JSONRPCError,
+    MethodNotFoundError,
 )
 from pydantic import ValidationError
+import asyncio
+import contextlib
+import hashlib
 import json
 from typing import AsyncIterable, Any
 from a2a.server.task_manager import TaskManager
+from a2a.server.sse import EncodedStreamingResponse
+from a2a.server.dispatch import MethodRoute, MethodStats, MethodHandler, PreHook, PostHook, method_name, \
+    build_request_adapter
 
 import logging
 
+try:
+    # Optional, faster decoding of batch arrays.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
 
 class A2AServer:
+    AGENT_CARD_CACHE_CONTROL = "public, max-age=300"
+
     def __init__(
         self,
         host="0.0.0.0",
@@ -35,18 +51,75 @@ class A2AServer:
         endpoint="/",
         agent_card: AgentCard = None,
         task_manager: TaskManager = None,
+        workers: int = 1,
     ):
         self.host = host
+        self.workers = workers
         self.port = port
         self.endpoint = endpoint
         self.task_manager = task_manager
         self.agent_card = agent_card
-        self.app = Starlette()
+        self._encoded_agent_card: tuple[AgentCard, bytes, str] | None = None
+        self.routes: dict[str, MethodRoute] = {}
+        self._request_adapter = None
+        self._register_task_manager_methods()
+        self.app = Starlette(lifespan=self._lifespan)
         self.app.add_route(self.endpoint, self._process_request, methods=["POST"])
         self.app.add_route(
             "/.well-known/agent.json", self._get_agent_card, methods=["GET"]
         )
 
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, _app: Starlette):
+        yield
+        # Pending store writes are committed before the process exits.
+        if self.task_manager is not None:
+            await self.task_manager.close()
+
+    def _register_task_manager_methods(self):
+        task_manager_methods = [
+            (GetTaskRequest, "on_get_task", False),
+            (SendTaskRequest, "on_send_task", False),
+            (SendTaskStreamingRequest, "on_send_task_subscribe", True),
+            (CancelTaskRequest, "on_cancel_task", False),
+            (SetTaskPushNotificationRequest, "on_set_task_push_notification", False),
+            (GetTaskPushNotificationRequest, "on_get_task_push_notification", False),
+            (TaskResubscriptionRequest, "on_resubscribe_to_task", True),
+        ]
+        for request_type, handler_name, streaming in task_manager_methods:
+            self.register_method(request_type, self._task_manager_handler(handler_name), streaming=streaming)
+
+    def _task_manager_handler(self, handler_name: str) -> MethodHandler:
+        # Resolved on each call, the task manager may be set after the server is created.
+        async def handler(json_rpc_request: JSONRPCRequest) -> Any:
+            return await getattr(self.task_manager, handler_name)(json_rpc_request)
+
+        return handler
+
+    def register_method(
+            self, request_type: type[JSONRPCRequest], handler: MethodHandler, streaming: bool = False
+    ) -> MethodRoute:
+        """Routes the JSON-RPC method declared by `request_type` to `handler`.
+
+        The request type must define `method` as a Literal with a default value.
+        Streaming handlers return an AsyncIterable and cannot be used in batches.
+        """
+        route = MethodRoute(request_type, handler, streaming)
+        self.routes[method_name(request_type)] = route
+        self._request_adapter = build_request_adapter([route.request_type for route in self.routes.values()])
+        return route
+
+    def add_pre_hook(self, hook: PreHook, methods: list[str] = None):
+        for method in methods or self.routes:
+            self.routes[method].pre_hooks.append(hook)
+
+    def add_post_hook(self, hook: PostHook, methods: list[str] = None):
+        for method in methods or self.routes:
+            self.routes[method].post_hooks.append(hook)
+
+    def get_method_stats(self) -> dict[str, MethodStats]:
+        return {method: route.stats.model_copy() for method, route in self.routes.items()}
+
     def start(self):
         if self.agent_card is None:
             raise ValueError("agent_card is not defined")
@@ -56,65 +129,164 @@ class A2AServer:
 
         import uvicorn
 
-        uvicorn.run(self.app, host=self.host, port=self.port)
+        if self.workers <= 1:
+            uvicorn.run(self.app, host=self.host, port=self.port)
+            return
+
+        if not self.task_manager.shared_state:
+            raise ValueError("task_manager must use a shared task store and event stream to run several workers")
+
+        self._run_workers()
+
+    def _run_workers(self):
+        """Forks `workers` processes serving the app on a socket bound once by the parent."""
+        import multiprocessing
+        import uvicorn
+
+        config = uvicorn.Config(self.app, host=self.host, port=self.port)
+        sock = config.bind_socket()
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=self._run_worker, args=(config, sock))
+            for _ in range(self.workers)
+        ]
+
+        logger.info(f"Starting {self.workers} workers on {self.host}:{self.port}")
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+                process.join()
+        finally:
+            sock.close()
+
+    @staticmethod
+    def _run_worker(config, sock):
+        import uvicorn
+
+        uvicorn.Server(config).run(sockets=[sock])
 
-    def _get_agent_card(self, request: Request) -> JSONResponse:
-        return JSONResponse(self.agent_card.model_dump(exclude_none=True))
+    def _get_agent_card(self, request: Request) -> Response:
+        body, etag = self._encode_agent_card()
+        headers = {"ETag": etag, "Cache-Control": self.AGENT_CARD_CACHE_CONTROL}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            if "*" in candidates or etag in candidates:
+                return Response(status_code=304, headers=headers)
+
+        return Response(body, media_type="application/json", headers=headers)
+
+    def _encode_agent_card(self) -> tuple[bytes, str]:
+        """Serializes the agent card once, again only if another card is assigned."""
+        if self._encoded_agent_card is None or self._encoded_agent_card[0] is not self.agent_card:
+            body = self.agent_card.model_dump_json(exclude_none=True).encode()
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            self._encoded_agent_card = (self.agent_card, body, etag)
+
+        return self._encoded_agent_card[1], self._encoded_agent_card[2]
 
     async def _process_request(self, request: Request):
         try:
-            body = await request.json()
-            json_rpc_request = A2ARequest.validate_python(body)
-
-            if isinstance(json_rpc_request, GetTaskRequest):
-                result = await self.task_manager.on_get_task(json_rpc_request)
-            elif isinstance(json_rpc_request, SendTaskRequest):
-                result = await self.task_manager.on_send_task(json_rpc_request)
-            elif isinstance(json_rpc_request, SendTaskStreamingRequest):
-                result = await self.task_manager.on_send_task_subscribe(
-                    json_rpc_request
-                )
-            elif isinstance(json_rpc_request, CancelTaskRequest):
-                result = await self.task_manager.on_cancel_task(json_rpc_request)
-            elif isinstance(json_rpc_request, SetTaskPushNotificationRequest):
-                result = await self.task_manager.on_set_task_push_notification(json_rpc_request)
-            elif isinstance(json_rpc_request, GetTaskPushNotificationRequest):
-                result = await self.task_manager.on_get_task_push_notification(json_rpc_request)
-            elif isinstance(json_rpc_request, TaskResubscriptionRequest):
-                result = await self.task_manager.on_resubscribe_to_task(
-                    json_rpc_request
-                )
-            else:
-                logger.warning(f"Unexpected request type: {type(json_rpc_request)}")
-                raise ValueError(f"Unexpected request type: {type(request)}")
+            body = await request.body()
+            if body.lstrip()[:1] == b"[":
+                return await self._process_batch(json_loads(body))
 
+            # Validating from the raw bytes skips building an intermediate dict.
+            json_rpc_request = self._request_adapter.validate_json(body)
+            if isinstance(json_rpc_request, TaskResubscriptionRequest):
+                self._set_last_event_id(request, json_rpc_request)
+
+            result = await self._dispatch(json_rpc_request)
             return self._create_response(result)
 
         except Exception as e:
             return self._handle_exception(e)
 
-    def _handle_exception(self, e: Exception) -> JSONResponse:
+    async def _dispatch(self, json_rpc_request: JSONRPCRequest) -> Any:
+        return await self.routes[json_rpc_request.method](json_rpc_request)
+
+    async def _process_batch(self, batch: list) -> Response:
+        """Dispatches the requests of a JSON-RPC batch concurrently and returns all responses at once."""
+        if len(batch) == 0:
+            response = JSONRPCResponse(id=None, error=InvalidRequestError(message="Empty batch"))
+            return self._json_response(response, status_code=400)
+
+        responses = await asyncio.gather(*(self._process_batch_item(item) for item in batch))
+        content = b"[" + b",".join(response.model_dump_json(exclude_none=True).encode() for response in responses) + b"]"
+        return Response(content, media_type="application/json")
+
+    async def _process_batch_item(self, item: Any) -> JSONRPCResponse:
+        request_id = item.get("id") if isinstance(item, dict) else None
+        try:
+            json_rpc_request = self._request_adapter.validate_python(item)
+            if self.routes[json_rpc_request.method].streaming:
+                return JSONRPCResponse(
+                    id=request_id, error=InvalidRequestError(message="Streaming methods cannot be batched")
+                )
+
+            result = await self._dispatch(json_rpc_request)
+            if not isinstance(result, JSONRPCResponse):
+                logger.error(f"Unexpected result type: {type(result)}")
+                raise ValueError(f"Unexpected result type: {type(result)}")
+            return result
+        except Exception as e:
+            return JSONRPCResponse(id=request_id, error=self._to_json_rpc_error(e))
+
+    @staticmethod
+    def _set_last_event_id(request: Request, json_rpc_request: TaskResubscriptionRequest):
+        """Forwards the SSE Last-Event-ID header to the task manager through the params metadata."""
+        last_event_id = request.headers.get("last-event-id")
+        if last_event_id is None:
+            return
+
+        if json_rpc_request.params.metadata is None:
+            json_rpc_request.params.metadata = {}
+        json_rpc_request.params.metadata.setdefault("lastEventId", last_event_id)
+
+    def _handle_exception(self, e: Exception) -> Response:
+        response = JSONRPCResponse(id=None, error=self._to_json_rpc_error(e))
+        return self._json_response(response, status_code=400)
+
+    @staticmethod
+    def _json_response(response: JSONRPCResponse, status_code: int = 200) -> Response:
+        """Encodes the response straight to JSON bytes, without an intermediate dict."""
+        return Response(
+            response.model_dump_json(exclude_none=True), status_code=status_code, media_type="application/json"
+        )
+
+    @staticmethod
+    def _to_json_rpc_error(e: Exception) -> JSONRPCError:
         if isinstance(e, json.decoder.JSONDecodeError):
-            json_rpc_error = JSONParseError()
+            return JSONParseError()
+        elif isinstance(e, ValidationError) and any(error["type"] == "json_invalid" for error in e.errors()):
+            return JSONParseError()
+        elif isinstance(e, ValidationError) and any(error["type"] == "union_tag_invalid" for error in e.errors()):
+            return MethodNotFoundError()
         elif isinstance(e, ValidationError):
-            json_rpc_error = InvalidRequestError(data=json.loads(e.json()))
+            return InvalidRequestError(data=json.loads(e.json()))
         else:
             logger.error(f"Unhandled exception: {e}")
-            json_rpc_error = InternalError()
-
-        response = JSONRPCResponse(id=None, error=json_rpc_error)
-        return JSONResponse(response.model_dump(exclude_none=True), status_code=400)
+            return InternalError()
 
-    def _create_response(self, result: Any) -> JSONResponse | EventSourceResponse:
+    def _create_response(self, result: Any) -> Response | EventSourceResponse:
         if isinstance(result, AsyncIterable):
 
             async def event_generator(result) -> AsyncIterable[dict[str, str]]:
                 async for item in result:
-                    yield {"data": item.model_dump_json(exclude_none=True)}
+                    if isinstance(item, EncodedStreamingResponse):
+                        yield item.to_sse_frame()
+                    else:
+                        yield {"data": item.model_dump_json(exclude_none=True)}
 
             return EventSourceResponse(event_generator(result))
         elif isinstance(result, JSONRPCResponse):
-            return JSONResponse(result.model_dump(exclude_none=True))
+            return self._json_response(result)
         else:
             logger.error(f"Unexpected result type: {type(result)}")
             raise ValueError(f"Unexpected result type: {type(result)}")
\ No newline at end of file
@@ -0,0 +1,159 @@
+import asyncio
+import json
+from collections import deque
+from enum import Enum
+from itertools import islice
+
+from pydantic import BaseModel
+
+from a2a.common.types import TaskStatusUpdateEvent, TaskArtifactUpdateEvent, TaskState, TextPart
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when an SSE subscriber queue is full."""
+    BLOCK = "block"  # wait for the subscriber to catch up
+    # Drop WORKING status updates and merge streamed artifact chunks into the last
+    # queued chunk, wait for the others.
+    DROP_INTERMEDIATE = "drop-intermediate"
+    DISCONNECT = "disconnect"  # end the subscriber stream with an error
+
+
+class SubscriberStats(BaseModel):
+    blocked_events: int = 0
+    dropped_events: int = 0
+    merged_events: int = 0
+    disconnected_consumers: int = 0
+
+
+class EncodedEvent:
+    """A task event serialized once, the same bytes are shared by every subscriber stream."""
+
+    __slots__ = ("event", "data", "seq")
+
+    def __init__(self, event: TaskStatusUpdateEvent | TaskArtifactUpdateEvent, data: bytes = None):
+        self.event = event
+        self.data: bytes = data or event.model_dump_json(exclude_none=True).encode()
+        self.seq: int | None = None
+
+
+class TaskEventLog:
+    """Bounded log of the latest events of a task, numbered by a per-task sequence.
+
+    Sequence numbers are sent as SSE event ids so a client can resume after the
+    last event it has seen.
+    """
+
+    def __init__(self, max_events: int, last_seq: int = 0):
+        self.events: deque[EncodedEvent] = deque(maxlen=max_events)
+        self.last_seq = last_seq
+
+    def append(self, event: EncodedEvent):
+        self.last_seq += 1
+        event.seq = self.last_seq
+        self.events.append(event)
+
+    def events_after(self, seq: int) -> list[EncodedEvent]:
+        if not self.events or seq >= self.last_seq:
+            return []
+        start = max(seq - self.events[0].seq + 1, 0)
+        return list(islice(self.events, start, None))
+
+    def has_ended_by(self, seq: int) -> bool:
+        """True when the logged stream has ended and `seq` is its final event or later."""
+        return bool(self.events) and is_final_event(self.events[-1]) and seq >= self.last_seq
+
+    def is_complete_after(self, seq: int) -> bool:
+        """False when events following `seq` have already been dropped from the log."""
+        return not self.events or seq + 1 >= self.events[0].seq
+
+
+class SubscriberQueue(asyncio.Queue):
+    """Queue of the events pending for one SSE subscriber."""
+
+    def merge_into_last(self, event: EncodedEvent) -> bool:
+        """Merges an artifact chunk into the last queued event, False when they cannot be merged."""
+        if not self._queue or not isinstance(self._queue[-1], EncodedEvent):
+            return False
+        merged = merge_artifact_chunks(self._queue[-1], event)
+        if merged is None:
+            return False
+        self._queue[-1] = merged
+        return True
+
+
+class EncodedStreamingResponse:
+    """SendTaskStreamingResponse for an already encoded event.
+
+    The JSON-RPC envelope only differs by request id between subscribers, it is
+    written around the shared event bytes instead of serializing a new response.
+    """
+
+    __slots__ = ("id", "encoded_event", "_prefix")
+
+    def __init__(self, request_id, encoded_event: EncodedEvent, prefix: bytes = None):
+        self.id = request_id
+        self.encoded_event = encoded_event
+        self._prefix = prefix or sse_response_prefix(request_id)
+
+    @property
+    def result(self) -> TaskStatusUpdateEvent | TaskArtifactUpdateEvent:
+        return self.encoded_event.event
+
+    def to_sse_frame(self) -> bytes:
+        frame = (self._prefix, self.encoded_event.data, b"}\r\n\r\n")
+        if self.encoded_event.seq is not None:
+            frame = (b"id: %d\r\n" % self.encoded_event.seq,) + frame
+        return b"".join(frame)
+
+
+def sse_response_prefix(request_id) -> bytes:
+    if request_id is None:
+        return b'data: {"jsonrpc":"2.0","result":'
+    return b'data: {"jsonrpc":"2.0","id":' + json.dumps(request_id).encode() + b',"result":'
+
+
+def is_intermediate_event(event) -> bool:
+    if isinstance(event, EncodedEvent):
+        event = event.event
+    return (
+        isinstance(event, TaskStatusUpdateEvent)
+        and not event.final
+        and event.status.state == TaskState.WORKING
+    )
+
+
+def is_artifact_chunk(event) -> bool:
+    if isinstance(event, EncodedEvent):
+        event = event.event
+    return isinstance(event, TaskArtifactUpdateEvent) and event.artifact.lastChunk is False
+
+
+def merge_artifact_chunks(first: EncodedEvent, second: EncodedEvent) -> EncodedEvent | None:
+    """One event carrying the chunks of both events, None when `second` does not extend `first`.
+
+    The merged event takes the sequence number of `second`, a client resuming
+    after it has seen both chunks.
+    """
+    if not is_artifact_chunk(first) or not is_artifact_chunk(second):
+        return None
+    previous, event = first.event, second.event
+    if not event.artifact.append or previous.id != event.id or previous.artifact.index != event.artifact.index:
+        return None
+
+    parts = list(previous.artifact.parts)
+    for part in event.artifact.parts:
+        if parts and isinstance(part, TextPart) and isinstance(parts[-1], TextPart):
+            parts[-1] = parts[-1].model_copy(update={"text": parts[-1].text + part.text})
+        else:
+            parts.append(part)
+
+    artifact = previous.artifact.model_copy(update={"parts": parts})
+    merged = EncodedEvent(previous.model_copy(update={"artifact": artifact}))
+    merged.seq = second.seq
+    return merged
+
+
+def is_final_event(event) -> bool:
+    if isinstance(event, EncodedEvent):
+        event = event.event
+    return isinstance(event, TaskStatusUpdateEvent) and event.final
@@ -3,6 +3,12 @@ from typing import Union, AsyncIterable, List
 
 from a2a.common.common import new_not_implemented_error
 from a2a.common.types import Task
+from a2a.server.task_store import TaskStore, InMemoryTaskStore
+from a2a.server.retention import RetentionPolicy, RetentionStats, TERMINAL_TASK_STATES, message_size, \
+    artifacts_size
+from a2a.server.sse import SlowConsumerPolicy, SubscriberStats, EncodedEvent, EncodedStreamingResponse, \
+    SubscriberQueue, TaskEventLog, is_intermediate_event, is_final_event, sse_response_prefix
+from a2a.server.event_stream import TaskEventStream
 from a2a.common.types import (
     JSONRPCResponse,
     TaskIdParams,
@@ -28,17 +34,29 @@ from a2a.common.types import (
     Artifact,
     PushNotificationConfig,
     TaskStatusUpdateEvent,
+    TaskArtifactUpdateEvent,
     JSONRPCError,
     TaskPushNotificationConfig,
     InternalError,
+    Message,
+    SlowConsumerError,
+    TextPart,
 )
+from collections import OrderedDict
 import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# States in which the agent is still producing the task, a cancel request interrupts it.
+CANCELABLE_TASK_STATES = (TaskState.SUBMITTED, TaskState.WORKING)
+
 
 class TaskManager(ABC):
+    # True when tasks and their events are visible to every server worker process.
+    shared_state: bool = False
+
     @abstractmethod
     async def on_get_task(self, request: GetTaskRequest) -> GetTaskResponse:
         pass
@@ -75,21 +93,73 @@ class TaskManager(ABC):
     ) -> Union[AsyncIterable[SendTaskResponse], JSONRPCResponse]:
         pass
 
+    async def close(self):
+        """Releases the resources of the task manager, called when the server shuts down."""
+        pass
+
 
 class InMemoryTaskManager(TaskManager):
-    def __init__(self):
-        self.tasks: dict[str, Task] = {}
-        self.push_notification_infos: dict[str, PushNotificationConfig] = {}
-        self.lock = asyncio.Lock()
+    def __init__(self, task_store: TaskStore = None, lock_stripes: int = 256,
+                 retention_policy: RetentionPolicy = None, max_history_length: int | None = None,
+                 sse_queue_size: int = 1024, slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.BLOCK,
+                 event_log_size: int = 256, event_log_ttl: float = 30.0, event_stream: TaskEventStream = None,
+                 event_poll_interval: float = 0.1):
+        self.task_store: TaskStore = task_store or InMemoryTaskStore()
+        # Hard cap on messages kept per task, the oldest messages are dropped first.
+        self.max_history_length = max_history_length
+        self.retention_policy = retention_policy
+        self.retention_stats = RetentionStats()
+        # Approximate history size of every known task, and finish time of
+        # terminal tasks in the order they finished.
+        self.task_history_bytes: dict[str, int] = {}
+        self.finished_tasks: OrderedDict[str, float] = OrderedDict()
+        self._retention_sweeper: asyncio.Task | None = None
+        # Tasks are guarded by a fixed table of locks indexed by task id, so
+        # updates on unrelated tasks do not contend on a single global lock.
+        self.task_locks: list[asyncio.Lock] = [asyncio.Lock() for _ in range(lock_stripes)]
+        self.running_agents: dict[str, asyncio.Task] = {}
+        self.cancel_timeout = 5.0
         self.task_sse_subscribers: dict[str, List[asyncio.Queue]] = {}
         self.subscriber_lock = asyncio.Lock()
+        self.sse_queue_size = sse_queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.subscriber_stats = SubscriberStats()
+        self.event_log_size = event_log_size
+        self.task_event_logs: dict[str, TaskEventLog] = {}
+        # Time an ended stream stays resumable before its log is dropped.
+        self.event_log_ttl = event_log_ttl
+        # Events shared with the other server workers, and last event delivered
+        # locally for each task running on another worker.
+        self.event_stream = event_stream
+        self.event_poll_interval = event_poll_interval
+        self.followed_event_seqs: dict[str, int] = {}
+        self.event_followers: dict[str, asyncio.Task] = {}
+
+    @property
+    def shared_state(self) -> bool:
+        return self.task_store.shared and self.event_stream is not None
+
+    def task_lock(self, task_id: str) -> asyncio.Lock:
+        return self.task_locks[hash(task_id) % len(self.task_locks)]
+
+    async def close(self):
+        if self._retention_sweeper is not None:
+            self._retention_sweeper.cancel()
+            self._retention_sweeper = None
+        followers = list(self.event_followers.values())
+        for follower in followers:
+            follower.cancel()
+        await asyncio.gather(*followers, return_exceptions=True)
+        await self.task_store.close()
+        if self.event_stream is not None:
+            await self.event_stream.close()
 
     async def on_get_task(self, request: GetTaskRequest) -> GetTaskResponse:
         logger.info(f"Getting task {request.params.id}")
         task_query_params: TaskQueryParams = request.params
 
-        async with self.lock:
-            task = self.tasks.get(task_query_params.id)
+        async with self.task_lock(task_query_params.id):
+            task = await self.task_store.get_task(task_query_params.id)
             if task is None:
                 return GetTaskResponse(id=request.id, error=TaskNotFoundError())
 
@@ -103,12 +173,52 @@ class InMemoryTaskManager(TaskManager):
         logger.info(f"Cancelling task {request.params.id}")
         task_id_params: TaskIdParams = request.params
 
-        async with self.lock:
-            task = self.tasks.get(task_id_params.id)
+        async with self.task_lock(task_id_params.id):
+            task = await self.task_store.get_task(task_id_params.id)
             if task is None:
                 return CancelTaskResponse(id=request.id, error=TaskNotFoundError())
 
-        return CancelTaskResponse(id=request.id, error=TaskNotCancelableError())
+        agent_run = self.running_agents.get(task_id_params.id)
+        if agent_run is None or task.status.state in TERMINAL_TASK_STATES:
+            return CancelTaskResponse(id=request.id, error=TaskNotCancelableError())
+
+        # Interrupts the in-flight agent call, releasing the LLM request, and waits
+        # for it to unwind so it cannot write a later status over CANCELED.
+        agent_run.cancel()
+        await asyncio.wait({agent_run}, timeout=self.cancel_timeout)
+        if not agent_run.done():
+            logger.warning(f"Agent of task {task_id_params.id} did not stop within {self.cancel_timeout}s")
+            return CancelTaskResponse(id=request.id, error=TaskNotCancelableError())
+
+        task_status = TaskStatus(state=TaskState.CANCELED)
+        async with self.task_lock(task_id_params.id):
+            task = await self.task_store.get_task(task_id_params.id)
+            # The run may have stored its last state before it was interrupted.
+            if task is None or task.status.state not in CANCELABLE_TASK_STATES:
+                return CancelTaskResponse(id=request.id, error=TaskNotCancelableError())
+            task.status = task_status
+            await self.task_store.save_task(task)
+            self._track_task(task, 0)
+
+        await self.send_task_notification(task)
+        await self.enqueue_events_for_sse(
+            task_id_params.id, TaskStatusUpdateEvent(id=task_id_params.id, status=task_status, final=True)
+        )
+
+        return CancelTaskResponse(id=request.id, result=self.append_task_history(task, None))
+
+    def register_running_agent(self, task_id: str, agent_run: asyncio.Task):
+        """Tracks the asyncio task running the agent for `task_id` so it can be canceled."""
+        self.running_agents[task_id] = agent_run
+
+        def unregister(_):
+            if self.running_agents.get(task_id) is agent_run:
+                del self.running_agents[task_id]
+
+        agent_run.add_done_callback(unregister)
+
+    async def send_task_notification(self, task: Task):
+        pass
 
     @abstractmethod
     async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
@@ -121,28 +231,32 @@ class InMemoryTaskManager(TaskManager):
         pass
 
     async def set_push_notification_info(self, task_id: str, notification_config: PushNotificationConfig):
-        async with self.lock:
-            task = self.tasks.get(task_id)
+        async with self.task_lock(task_id):
+            task = await self.task_store.get_task(task_id)
             if task is None:
                 raise ValueError(f"Task not found for {task_id}")
 
-            self.push_notification_infos[task_id] = notification_config
+            await self.task_store.set_push_notification_info(task_id, notification_config)
 
         return
 
     async def get_push_notification_info(self, task_id: str) -> PushNotificationConfig:
-        async with self.lock:
-            task = self.tasks.get(task_id)
+        async with self.task_lock(task_id):
+            task = await self.task_store.get_task(task_id)
             if task is None:
                 raise ValueError(f"Task not found for {task_id}")
 
-            return self.push_notification_infos[task_id]
+            notification_info = await self.task_store.get_push_notification_info(task_id)
+            if notification_info is None:
+                raise ValueError(f"Push notification info not found for {task_id}")
+
+            return notification_info
 
         return
 
     async def has_push_notification_info(self, task_id: str) -> bool:
-        async with self.lock:
-            return task_id in self.push_notification_infos
+        async with self.task_lock(task_id):
+            return await self.task_store.has_push_notification_info(task_id)
 
     async def on_set_task_push_notification(
             self, request: SetTaskPushNotificationRequest
@@ -186,20 +300,20 @@ class InMemoryTaskManager(TaskManager):
 
     async def upsert_task(self, task_send_params: TaskSendParams) -> Task:
         logger.info(f"Upserting task {task_send_params.id}")
-        async with self.lock:
-            task = self.tasks.get(task_send_params.id)
+        async with self.task_lock(task_send_params.id):
+            task = await self.task_store.get_task(task_send_params.id)
             if task is None:
                 task = Task(
                     id=task_send_params.id,
                     sessionId=task_send_params.sessionId,
-                    messages=[task_send_params.message],
                     status=TaskStatus(state=TaskState.SUBMITTED),
-                    history=[task_send_params.message],
+                    history=[],
                 )
-                self.tasks[task_send_params.id] = task
-            else:
-                task.history.append(task_send_params.message)
+            history_bytes = self._append_history(task, task_send_params.message)
 
+            await self.task_store.save_task(task)
+            self._track_task(task, history_bytes)
+            self._start_retention_sweeper()
             return task
 
     async def on_resubscribe_to_task(
@@ -210,71 +324,414 @@ class InMemoryTaskManager(TaskManager):
     async def update_store(
             self, task_id: str, status: TaskStatus, artifacts: list[Artifact]
     ) -> Task:
-        async with self.lock:
-            try:
-                task = self.tasks[task_id]
-            except KeyError:
+        async with self.task_lock(task_id):
+            task = await self.task_store.get_task(task_id)
+            if task is None:
                 logger.error(f"Task {task_id} not found for updating the task")
                 raise ValueError(f"Task {task_id} not found")
 
             task.status = status
 
+            history_bytes = 0
             if status.message is not None:
-                task.history.append(status.message)
+                history_bytes = self._append_history(task, status.message)
 
             if artifacts is not None:
                 if task.artifacts is None:
                     task.artifacts = []
-                task.artifacts.extend(artifacts)
-
+                # Streamed chunks grow the stored artifacts, their bytes count towards max_history_bytes.
+                history_bytes -= artifacts_size(task.artifacts)
+                for artifact in artifacts:
+                    self._merge_artifact(task, artifact)
+                history_bytes += artifacts_size(task.artifacts)
+
+            await self.task_store.save_task(task)
+            self._track_task(task, history_bytes)
             return task
 
+    @staticmethod
+    def _merge_artifact(task: Task, artifact: Artifact):
+        """Stores the artifact by index, chunks sent with `append` extend the stored artifact."""
+        # Parts are copied as appended text is concatenated in place.
+        stored = artifact.model_copy(update={"parts": [part.model_copy() for part in artifact.parts]})
+        position = next((i for i, a in enumerate(task.artifacts) if a.index == artifact.index), None)
+        if position is None:
+            task.artifacts.append(stored)
+            return
+        if not artifact.append:
+            task.artifacts[position] = stored
+            return
+
+        existing = task.artifacts[position]
+        for part in stored.parts:
+            if existing.parts and isinstance(part, TextPart) and isinstance(existing.parts[-1], TextPart):
+                existing.parts[-1].text += part.text
+            else:
+                existing.parts.append(part)
+        existing.lastChunk = artifact.lastChunk
+
+    def _append_history(self, task: Task, message: Message) -> int:
+        """Appends a message to the task history, enforcing max_history_length.
+
+        Returns the change of the approximate history size in bytes.
+        """
+        if task.history is None:
+            task.history = []
+        task.history.append(message)
+        history_bytes = message_size(message)
+
+        if self.max_history_length is not None and len(task.history) > self.max_history_length:
+            excess = len(task.history) - self.max_history_length
+            history_bytes -= sum(message_size(m) for m in task.history[:excess])
+            del task.history[:excess]
+
+        return history_bytes
+
+    def _track_task(self, task: Task, history_bytes: int):
+        self.task_history_bytes[task.id] = self.task_history_bytes.get(task.id, 0) + history_bytes
+        self.retention_stats.history_bytes += history_bytes
+
+        if task.status.state in TERMINAL_TASK_STATES:
+            self.finished_tasks[task.id] = time.monotonic()
+            self.finished_tasks.move_to_end(task.id)
+        else:
+            self.finished_tasks.pop(task.id, None)
+
+    def _start_retention_sweeper(self):
+        if self.retention_policy is None or self._retention_sweeper is not None:
+            return
+        self._retention_sweeper = asyncio.create_task(self._run_retention_sweeper())
+
+    async def _run_retention_sweeper(self):
+        try:
+            await self._track_stored_tasks()
+        except Exception as e:
+            logger.error(f"Error while loading stored tasks for retention: {e}")
+
+        while True:
+            await asyncio.sleep(self.retention_policy.sweep_interval)
+            try:
+                await self.sweep_tasks()
+            except Exception as e:
+                logger.error(f"Error while sweeping finished tasks: {e}")
+
+    async def _track_stored_tasks(self):
+        """Tracks the tasks stored by earlier processes so that the retention policy applies to them."""
+        tracked = 0
+        async for task in self.task_store.iter_tasks():
+            if task.id in self.task_history_bytes:
+                continue
+            history_bytes = sum(message_size(m) for m in task.history or []) + artifacts_size(task.artifacts)
+            self.task_history_bytes[task.id] = history_bytes
+            self.retention_stats.history_bytes += history_bytes
+            if task.status.state in TERMINAL_TASK_STATES:
+                # Finished before any task of this process, kept in front of the eviction order.
+                finished_at = min(time.monotonic(), next(iter(self.finished_tasks.values()), float("inf")))
+                self.finished_tasks[task.id] = finished_at
+                self.finished_tasks.move_to_end(task.id, last=False)
+            tracked += 1
+
+        if tracked:
+            logger.info(f"Tracking {tracked} stored tasks for retention")
+
+    async def sweep_tasks(self) -> int:
+        """Evicts finished tasks exceeding the retention policy and returns the number of evicted tasks."""
+        policy = self.retention_policy
+        if policy is None:
+            return 0
+
+        now = time.monotonic()
+        finished = list(self.finished_tasks.items())
+        evictions: list[tuple[str, str]] = []
+        position = 0
+
+        if policy.max_finished_age is not None:
+            while position < len(finished) and now - finished[position][1] >= policy.max_finished_age:
+                evictions.append((finished[position][0], "evicted_by_age"))
+                position += 1
+
+        if policy.max_tasks is not None:
+            excess = len(self.task_history_bytes) - len(evictions) - policy.max_tasks
+            while excess > 0 and position < len(finished):
+                evictions.append((finished[position][0], "evicted_by_count"))
+                position += 1
+                excess -= 1
+
+        if policy.max_history_bytes is not None:
+            history_bytes = self.retention_stats.history_bytes - sum(
+                self.task_history_bytes.get(task_id, 0) for task_id, _ in evictions
+            )
+            while history_bytes > policy.max_history_bytes and position < len(finished):
+                task_id = finished[position][0]
+                evictions.append((task_id, "evicted_by_history_bytes"))
+                history_bytes -= self.task_history_bytes.get(task_id, 0)
+                position += 1
+
+        evicted = 0
+        for task_id, reason in evictions:
+            if await self.evict_task(task_id):
+                setattr(self.retention_stats, reason, getattr(self.retention_stats, reason) + 1)
+                evicted += 1
+
+        if evicted:
+            logger.info(f"Evicted {evicted} finished tasks, {len(self.task_history_bytes)} tasks retained")
+        return evicted
+
+    async def evict_task(self, task_id: str) -> bool:
+        async with self.task_lock(task_id):
+            # The task may have been resumed since the sweep started.
+            if task_id not in self.finished_tasks:
+                return False
+
+            await self.task_store.delete_task(task_id)
+            self.finished_tasks.pop(task_id, None)
+            self.retention_stats.history_bytes -= self.task_history_bytes.pop(task_id, 0)
+
+        async with self.subscriber_lock:
+            subscribers = self.task_sse_subscribers.get(task_id)
+            if subscribers is not None and len(subscribers) == 0:
+                del self.task_sse_subscribers[task_id]
+            self.task_event_logs.pop(task_id, None)
+
+        if self.event_stream is not None:
+            await self.event_stream.delete_task(task_id)
+
+        return True
+
+    def get_retention_stats(self) -> RetentionStats:
+        stats = self.retention_stats.model_copy()
+        stats.tasks = len(self.task_history_bytes)
+        stats.finished_tasks = len(self.finished_tasks)
+        stats.sse_subscribed_tasks = len(self.task_sse_subscribers)
+        return stats
+
+    def get_subscriber_stats(self) -> SubscriberStats:
+        return self.subscriber_stats.model_copy()
+
     def append_task_history(self, task: Task, historyLength: int | None):
-        new_task = task.model_copy()
-        if historyLength is not None and historyLength > 0:
-            new_task.history = new_task.history[-historyLength:]
+        """Returns a shallow copy of the task holding only the last `historyLength` messages.
+
+        Only the requested tail is referenced, the stored history and messages are shared.
+        """
+        if historyLength is not None and historyLength > 0 and task.history:
+            history = task.history[-historyLength:]
         else:
-            new_task.history = []
+            history = []
 
-        return new_task
+        return task.model_copy(update={"history": history})
 
-    async def setup_sse_consumer(self, task_id: str, is_resubscribe: bool = False):
+    async def setup_sse_consumer(self, task_id: str, is_resubscribe: bool = False,
+                                 last_event_id: int | None = None):
+        """Registers a subscriber queue for the task.
+
+        When resubscribing with `last_event_id`, the logged events following it
+        are queued before any live event.
+        """
         async with self.subscriber_lock:
+            if self.event_stream is not None and is_resubscribe and task_id not in self.running_agents:
+                return await self._setup_shared_sse_consumer(task_id, last_event_id)
+
+            event_log = self.task_event_logs.get(task_id)
+            if is_resubscribe and last_event_id is not None and event_log is not None \
+                    and event_log.has_ended_by(last_event_id):
+                # The client has seen the final event, e.g. an EventSource reconnecting.
+                raise ValueError("Task stream has already ended")
+
             if task_id not in self.task_sse_subscribers:
-                if is_resubscribe:
+                # A finished stream can only be resumed by replaying its log.
+                if is_resubscribe and (last_event_id is None or task_id not in self.task_event_logs):
                     raise ValueError("Task not found for resubscription")
-                else:
-                    self.task_sse_subscribers[task_id] = []
+                self.task_sse_subscribers[task_id] = []
+
+            if task_id not in self.task_event_logs:
+                # Continue the sequence of events emitted by other workers for this task.
+                last_seq = 0 if self.event_stream is None else await self.event_stream.last_seq(task_id)
+                self.task_event_logs[task_id] = TaskEventLog(self.event_log_size, last_seq)
+
+            missed_events = []
+            if is_resubscribe and last_event_id is not None:
+                event_log = self.task_event_logs[task_id]
+                if not event_log.is_complete_after(last_event_id):
+                    logger.warning(f"Events after {last_event_id} of task {task_id} are no longer available")
+                missed_events = event_log.events_after(last_event_id)
+
+            return self._add_sse_consumer(task_id, missed_events)
+
+    def _add_sse_consumer(self, task_id: str, missed_events: list[EncodedEvent]) -> asyncio.Queue:
+        sse_event_queue = SubscriberQueue(maxsize=max(self.sse_queue_size, len(missed_events) + 1))
+        for event in missed_events:
+            sse_event_queue.put_nowait(event)
+        self.task_sse_subscribers.setdefault(task_id, []).append(sse_event_queue)
+        return sse_event_queue
+
+    async def _setup_shared_sse_consumer(self, task_id: str, last_event_id: int | None) -> asyncio.Queue:
+        """Subscribes to a task whose agent runs on another worker, through the shared event stream.
+
+        Must be called with the subscriber lock held.
+        """
+        task = await self.task_store.get_task(task_id)
+        if task is None or (last_event_id is None and task.status.state in TERMINAL_TASK_STATES):
+            raise ValueError("Task not found for resubscription")
+
+        followed_seq = self.followed_event_seqs.get(task_id)
+        missed_events = []
+        if last_event_id is not None:
+            missed_events = await self.event_stream.read_after(task_id, last_event_id)
+            if followed_seq is not None:
+                # Later events are delivered by the running follower.
+                missed_events = [event for event in missed_events if event.seq <= followed_seq]
+
+        if followed_seq is None and not missed_events and task.status.state in TERMINAL_TASK_STATES:
+            # Nothing is left to replay and no event will follow.
+            raise ValueError("Task stream has already ended")
+
+        if followed_seq is None and not any(is_final_event(event) for event in missed_events):
+            if missed_events:
+                followed_seq = missed_events[-1].seq
+            elif last_event_id is not None:
+                followed_seq = last_event_id
+            else:
+                followed_seq = await self.event_stream.last_seq(task_id)
+            self.followed_event_seqs[task_id] = followed_seq
+            self._start_event_follower(task_id)
+
+        return self._add_sse_consumer(task_id, missed_events)
+
+    def _start_event_follower(self, task_id: str):
+        follower = asyncio.create_task(self._follow_shared_events(task_id))
+        self.event_followers[task_id] = follower
 
-            sse_event_queue = asyncio.Queue(maxsize=0)  # <=0 is unlimited
-            self.task_sse_subscribers[task_id].append(sse_event_queue)
-            return sse_event_queue
+        def unregister(_):
+            if self.event_followers.get(task_id) is follower:
+                del self.event_followers[task_id]
+
+        follower.add_done_callback(unregister)
+
+    async def _follow_shared_events(self, task_id: str):
+        """Polls the shared event stream and delivers new events to the local subscribers of the task."""
+        try:
+            while True:
+                await asyncio.sleep(self.event_poll_interval)
+                async with self.subscriber_lock:
+                    if not self.task_sse_subscribers.get(task_id):
+                        return
+                    followed_seq = self.followed_event_seqs[task_id]
+
+                for event in await self.event_stream.read_after(task_id, followed_seq):
+                    async with self.subscriber_lock:
+                        self.followed_event_seqs[task_id] = event.seq
+                        current_subscribers = list(self.task_sse_subscribers.get(task_id, []))
+
+                    for subscriber in current_subscribers:
+                        await self._enqueue_event(task_id, subscriber, event)
+
+                    if is_final_event(event):
+                        return
+        except Exception as e:
+            logger.error(f"Error while following shared events of task {task_id}: {e}")
+        finally:
+            self.followed_event_seqs.pop(task_id, None)
+
+    @staticmethod
+    def get_last_event_id(task_id_params: TaskIdParams) -> int | None:
+        """Reads the last SSE event id seen by a resubscribing client, sent in the params metadata."""
+        if task_id_params.metadata is None:
+            return None
+        try:
+            return int(task_id_params.metadata["lastEventId"])
+        except (KeyError, TypeError, ValueError):
+            return None
 
     async def enqueue_events_for_sse(self, task_id, task_update_event):
+        # Task events are serialized once and shared by every subscriber.
+        if isinstance(task_update_event, (TaskStatusUpdateEvent, TaskArtifactUpdateEvent)):
+            task_update_event = EncodedEvent(task_update_event)
+
         async with self.subscriber_lock:
-            if task_id not in self.task_sse_subscribers:
+            event_log = self.task_event_logs.get(task_id)
+            if event_log is not None and isinstance(task_update_event, EncodedEvent):
+                event_log.append(task_update_event)
+                if is_final_event(task_update_event):
+                    asyncio.get_running_loop().call_later(
+                        self.event_log_ttl, self._drop_ended_event_log, task_id, event_log
+                    )
+
+            current_subscribers = list(self.task_sse_subscribers.get(task_id, []))
+
+        if self.event_stream is not None and isinstance(task_update_event, EncodedEvent) \
+                and task_update_event.seq is not None:
+            await self.event_stream.append(task_id, task_update_event)
+
+        # Waiting on a full queue must not hold the subscriber lock, other tasks would stall.
+        for subscriber in current_subscribers:
+            await self._enqueue_event(task_id, subscriber, task_update_event)
+
+    def _drop_ended_event_log(self, task_id: str, event_log: TaskEventLog):
+        # The task may have been resumed, its log then holds newer events.
+        if self.task_event_logs.get(task_id) is event_log and event_log.has_ended_by(event_log.last_seq):
+            del self.task_event_logs[task_id]
+            if self.task_sse_subscribers.get(task_id) == []:
+                del self.task_sse_subscribers[task_id]
+
+    async def _enqueue_event(self, task_id, subscriber: SubscriberQueue, task_update_event):
+        if not subscriber.full():
+            subscriber.put_nowait(task_update_event)
+            return
+
+        if self.slow_consumer_policy == SlowConsumerPolicy.DISCONNECT:
+            async with self.subscriber_lock:
+                subscribers = self.task_sse_subscribers.get(task_id)
+                if subscribers is None or subscriber not in subscribers:
+                    return
+                subscribers.remove(subscriber)
+
+            # Release the pending events and let the consumer end its stream.
+            while not subscriber.empty():
+                subscriber.get_nowait()
+            subscriber.put_nowait(SlowConsumerError())
+            self.subscriber_stats.disconnected_consumers += 1
+            logger.warning(f"Disconnected slow SSE consumer of task {task_id}")
+            return
+
+        if self.slow_consumer_policy == SlowConsumerPolicy.DROP_INTERMEDIATE:
+            if is_intermediate_event(task_update_event):
+                self.subscriber_stats.dropped_events += 1
+                return
+            if subscriber.merge_into_last(task_update_event):
+                self.subscriber_stats.merged_events += 1
                 return
 
-            current_subscribers = self.task_sse_subscribers[task_id]
-            for subscriber in current_subscribers:
-                await subscriber.put(task_update_event)
+        self.subscriber_stats.blocked_events += 1
+        await subscriber.put(task_update_event)
 
     async def dequeue_events_for_sse(
             self, request_id, task_id, sse_event_queue: asyncio.Queue
-    ) -> AsyncIterable[SendTaskStreamingResponse] | JSONRPCResponse:
+    ) -> AsyncIterable[SendTaskStreamingResponse | EncodedStreamingResponse] | JSONRPCResponse:
+        stream_ended = False
+        prefix = sse_response_prefix(request_id)
         try:
             while True:
                 event = await sse_event_queue.get()
                 if isinstance(event, JSONRPCError):
+                    stream_ended = not isinstance(event, SlowConsumerError)
                     yield SendTaskStreamingResponse(id=request_id, error=event)
                     break
 
-                yield SendTaskStreamingResponse(id=request_id, result=event)
-                if isinstance(event, TaskStatusUpdateEvent) and event.final:
+                stream_ended = is_final_event(event)
+                yield EncodedStreamingResponse(request_id, event, prefix)
+                if stream_ended:
                     break
         finally:
             async with self.subscriber_lock:
                 if task_id in self.task_sse_subscribers:
-                    self.task_sse_subscribers[task_id].remove(sse_event_queue)
+                    if sse_event_queue in self.task_sse_subscribers[task_id]:
+                        self.task_sse_subscribers[task_id].remove(sse_event_queue)
+                    # Keep the entry while the task runs so clients can resubscribe.
+                    if stream_ended and len(self.task_sse_subscribers[task_id]) == 0:
+                        del self.task_sse_subscribers[task_id]
+
+            # Unblock a producer which may be waiting on this queue.
+            while not sse_event_queue.empty():
+                sse_event_queue.get_nowait()
 
 
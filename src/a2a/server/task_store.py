@@ -0,0 +1,242 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from a2a.common.types import Task, PushNotificationConfig
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TaskStore(ABC):
+    """Storage backend used by InMemoryTaskManager for tasks and push notification configs.
+
+    Tasks returned by `get_task` may be detached copies, callers must `save_task`
+    after mutating them.
+    """
+
+    # True when the stored state is visible to every server worker process.
+    shared: bool = False
+
+    @abstractmethod
+    async def get_task(self, task_id: str) -> Task | None:
+        pass
+
+    @abstractmethod
+    async def save_task(self, task: Task):
+        pass
+
+    @abstractmethod
+    async def get_push_notification_info(self, task_id: str) -> PushNotificationConfig | None:
+        pass
+
+    @abstractmethod
+    async def set_push_notification_info(self, task_id: str, notification_config: PushNotificationConfig):
+        pass
+
+    async def has_push_notification_info(self, task_id: str) -> bool:
+        return await self.get_push_notification_info(task_id) is not None
+
+    @abstractmethod
+    async def delete_task(self, task_id: str):
+        """Removes the task and its push notification config."""
+        pass
+
+    async def iter_tasks(self) -> AsyncIterator[Task]:
+        """Iterates over the stored tasks, including those stored by earlier processes.
+
+        Stores which cannot list their tasks yield none.
+        """
+        return
+        yield
+
+    async def close(self):
+        pass
+
+
+class InMemoryTaskStore(TaskStore):
+    def __init__(self):
+        self.tasks: dict[str, Task] = {}
+        self.push_notification_infos: dict[str, PushNotificationConfig] = {}
+
+    async def get_task(self, task_id: str) -> Task | None:
+        return self.tasks.get(task_id)
+
+    async def save_task(self, task: Task):
+        self.tasks[task.id] = task
+
+    async def get_push_notification_info(self, task_id: str) -> PushNotificationConfig | None:
+        return self.push_notification_infos.get(task_id)
+
+    async def set_push_notification_info(self, task_id: str, notification_config: PushNotificationConfig):
+        self.push_notification_infos[task_id] = notification_config
+
+    async def has_push_notification_info(self, task_id: str) -> bool:
+        return task_id in self.push_notification_infos
+
+    async def delete_task(self, task_id: str):
+        self.tasks.pop(task_id, None)
+        self.push_notification_infos.pop(task_id, None)
+
+    async def iter_tasks(self) -> AsyncIterator[Task]:
+        for task in list(self.tasks.values()):
+            yield task
+
+
+class SQLiteTaskStore(TaskStore):
+    """Durable task store backed by a SQLite database in WAL mode.
+
+    Writes are grouped in a single transaction which is committed every
+    `commit_batch_size` writes or `commit_interval` seconds, whichever comes first,
+    a background task commits pending writes once the interval has elapsed even
+    when no other write follows. Reads go through the same connection and always
+    see pending writes. `close()` commits whatever is still pending.
+
+    With `shared=True` every write is committed immediately so that other worker
+    processes see it and are never blocked by a pending transaction.
+    """
+
+    def __init__(self, path: str, commit_batch_size: int = 100, commit_interval: float = 0.05,
+                 shared: bool = False):
+        self.path = path
+        self.shared = shared
+        self.commit_batch_size = 1 if shared else commit_batch_size
+        self.commit_interval = commit_interval
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._db_lock = threading.Lock()
+        self._pending_writes = 0
+        self._last_commit = time.monotonic()
+        self._flusher: asyncio.Task | None = None
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared with forked worker processes.
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level="DEFERRED")
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks (id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS push_notification_infos (task_id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+            self._pending_writes = 0
+        return self._conn
+
+    def _read(self, query: str, args: tuple):
+        with self._db_lock:
+            return self._connection.execute(query, args).fetchone()
+
+    def _read_all(self, query: str, args: tuple) -> list:
+        with self._db_lock:
+            return self._connection.execute(query, args).fetchall()
+
+    def _write(self, query: str, args: tuple):
+        with self._db_lock:
+            self._connection.execute(query, args)
+            self._maybe_commit()
+
+    def _delete(self, task_id: str):
+        with self._db_lock:
+            self._connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            self._connection.execute("DELETE FROM push_notification_infos WHERE task_id = ?", (task_id,))
+            self._maybe_commit()
+
+    def _maybe_commit(self):
+        self._pending_writes += 1
+        if (
+                self._pending_writes >= self.commit_batch_size
+                or time.monotonic() - self._last_commit >= self.commit_interval
+        ):
+            self._commit()
+
+    def _commit(self):
+        self._connection.commit()
+        self._pending_writes = 0
+        self._last_commit = time.monotonic()
+
+    def flush(self):
+        with self._db_lock:
+            self._commit()
+
+    def _flush_pending(self):
+        with self._db_lock:
+            if self._pending_writes:
+                self._commit()
+
+    def _schedule_flush(self):
+        if self._pending_writes and (self._flusher is None or self._flusher.done()):
+            self._flusher = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self):
+        try:
+            await asyncio.sleep(self.commit_interval)
+            await asyncio.to_thread(self._flush_pending)
+        except Exception as e:
+            logger.error(f"Error while committing pending task writes: {e}")
+
+    async def get_task(self, task_id: str) -> Task | None:
+        row = await asyncio.to_thread(self._read, "SELECT data FROM tasks WHERE id = ?", (task_id,))
+        if row is None:
+            return None
+        return Task.model_validate_json(row[0])
+
+    async def save_task(self, task: Task):
+        await asyncio.to_thread(
+            self._write,
+            "INSERT OR REPLACE INTO tasks (id, data) VALUES (?, ?)",
+            (task.id, task.model_dump_json(exclude_none=True)),
+        )
+        self._schedule_flush()
+
+    async def get_push_notification_info(self, task_id: str) -> PushNotificationConfig | None:
+        row = await asyncio.to_thread(
+            self._read, "SELECT data FROM push_notification_infos WHERE task_id = ?", (task_id,)
+        )
+        if row is None:
+            return None
+        return PushNotificationConfig.model_validate_json(row[0])
+
+    async def set_push_notification_info(self, task_id: str, notification_config: PushNotificationConfig):
+        await asyncio.to_thread(
+            self._write,
+            "INSERT OR REPLACE INTO push_notification_infos (task_id, data) VALUES (?, ?)",
+            (task_id, notification_config.model_dump_json(exclude_none=True)),
+        )
+        self._schedule_flush()
+
+    async def delete_task(self, task_id: str):
+        await asyncio.to_thread(self._delete, task_id)
+        self._schedule_flush()
+
+    async def iter_tasks(self, page_size: int = 500) -> AsyncIterator[Task]:
+        # Paged by id so the database lock is not held for the whole table.
+        last_id = ""
+        while True:
+            rows = await asyncio.to_thread(
+                self._read_all, "SELECT id, data FROM tasks WHERE id > ? ORDER BY id LIMIT ?", (last_id, page_size)
+            )
+            for _, data in rows:
+                yield Task.model_validate_json(data)
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
+    async def close(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await asyncio.to_thread(self.flush)
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
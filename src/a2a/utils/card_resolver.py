@@ -1,21 +1,131 @@
+import asyncio
+import logging
+import re
+import time
+
 import httpx
 from a2a.common.types import (
     AgentCard,
     A2AClientJSONError,
 )
+from a2a.utils.in_memory_cache import InMemoryCache
 import json
 
+logger = logging.getLogger(__name__)
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
 
 class A2ACardResolver:
-    def __init__(self, base_url, agent_card_path="/.well-known/agent.json"):
+    """Fetches agent cards, cached across resolvers by URL.
+
+    A cached card is reused without any request while its Cache-Control max-age,
+    or `ttl` when the agent sends none, holds, and revalidated with If-None-Match
+    afterwards. `async_get_agent_card` falls back to the cached card when the
+    agent cannot be reached, and concurrent calls for one URL share a request.
+    """
+
+    # Requests in flight by card URL, shared by every resolver.
+    _fetches: dict[str, asyncio.Future] = {}
+
+    def __init__(self, base_url, agent_card_path="/.well-known/agent.json", ttl: int = 0, timeout: float = 5.0):
         self.base_url = base_url.rstrip("/")
         self.agent_card_path = agent_card_path.lstrip("/")
+        self.ttl = ttl
+        self.timeout = timeout
+        self.cache = InMemoryCache()
+
+    @property
+    def agent_card_url(self) -> str:
+        return self.base_url + "/" + self.agent_card_path
+
+    @property
+    def cache_key(self) -> str:
+        return f"agent_card:{self.agent_card_url}"
 
     def get_agent_card(self) -> AgentCard:
-        with httpx.Client() as client:
-            response = client.get(self.base_url + "/" + self.agent_card_path)
+        cached = self.cache.get(self.cache_key)
+        if cached is not None and time.monotonic() < cached["fresh_until"]:
+            return cached["card"]
+
+        with httpx.Client(timeout=self.timeout) as client:
+            response = client.get(self.agent_card_url, headers=self._revalidation_headers(cached))
+        return self._process_response(response, cached)
+
+    async def async_get_agent_card(self, client: httpx.AsyncClient = None) -> AgentCard:
+        cached = self.cache.get(self.cache_key)
+        if cached is not None and time.monotonic() < cached["fresh_until"]:
+            return cached["card"]
+
+        url = self.agent_card_url
+        fetch = self._fetches.get(url)
+        # A request started on another event loop, e.g. a previous UI turn, cannot be awaited.
+        if fetch is None or fetch.get_loop() is not asyncio.get_running_loop():
+            fetch = asyncio.ensure_future(self._fetch_agent_card(cached, client))
+            self._fetches[url] = fetch
+            fetch.add_done_callback(lambda done: self._fetches.pop(url) if self._fetches.get(url) is done else None)
+
+        try:
+            return await asyncio.shield(fetch)
+        except (httpx.HTTPError, A2AClientJSONError) as e:
+            if cached is None:
+                raise
+            logger.warning(f"Using cached agent card of {url} after a failed refresh: {e}")
+            return cached["card"]
+
+    async def _fetch_agent_card(self, cached: dict | None, client: httpx.AsyncClient = None) -> AgentCard:
+        headers = self._revalidation_headers(cached)
+        if client is not None:
+            response = await client.get(self.agent_card_url, headers=headers, timeout=self.timeout)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.agent_card_url, headers=headers)
+        return self._process_response(response, cached)
+
+    @staticmethod
+    def _revalidation_headers(cached: dict | None) -> dict[str, str]:
+        if cached is not None and cached["etag"] is not None:
+            return {"If-None-Match": cached["etag"]}
+        return {}
+
+    def _process_response(self, response: httpx.Response, cached: dict | None) -> AgentCard:
+        if cached is not None and response.status_code == 304:
+            card = cached["card"]
+        else:
             response.raise_for_status()
             try:
-                return AgentCard(**response.json())
+                card = AgentCard(**response.json())
             except json.JSONDecodeError as e:
-                raise A2AClientJSONError(str(e)) from e
\ No newline at end of file
+                raise A2AClientJSONError(str(e)) from e
+
+        etag = response.headers.get("etag")
+        max_age = MAX_AGE_PATTERN.search(response.headers.get("cache-control", ""))
+        fresh_for = int(max_age.group(1)) if max_age else self.ttl
+        if etag is not None or fresh_for > 0:
+            self.cache.set(self.cache_key, {
+                "card": card,
+                "etag": etag,
+                "fresh_until": time.monotonic() + fresh_for,
+            })
+
+        return card
+
+
+async def resolve_agent_cards(base_urls: list[str], ttl: int = 0) -> dict[str, AgentCard]:
+    """Fetches the cards of several agents concurrently, by base URL.
+
+    Agents whose card cannot be resolved are left out.
+    """
+    resolvers = [A2ACardResolver(base_url, ttl=ttl) for base_url in base_urls]
+    async with httpx.AsyncClient() as client:
+        results = await asyncio.gather(
+            *(resolver.async_get_agent_card(client) for resolver in resolvers), return_exceptions=True
+        )
+
+    cards = {}
+    for base_url, result in zip(base_urls, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Could not resolve the agent card of {base_url}: {result}")
+        else:
+            cards[base_url] = result
+    return cards
@@ -1,4 +1,6 @@
 from jwcrypto import jwk
+import asyncio
+import os
 import uuid
 from starlette.responses import JSONResponse
 from starlette.requests import Request
@@ -11,56 +13,138 @@ import hashlib
 import httpx
 import logging
 
-from jwt import PyJWK, PyJWKClient
+from jwt import PyJWK
+
+from a2a.utils.in_memory_cache import InMemoryCache
 
 logger = logging.getLogger(__name__)
 AUTH_HEADER_PREFIX = 'Bearer '
+# Key parameters generated for each supported signing algorithm.
+JWT_ALGORITHMS = {
+    "RS256": {"kty": "RSA", "size": 2048},
+    "ES256": {"kty": "EC", "crv": "P-256"},
+    "EdDSA": {"kty": "OKP", "crv": "Ed25519"},
+}
 
 
 class PushNotificationAuth:
-    def _calculate_request_body_sha256(self, data: dict[str, Any]):
-        """Calculates the SHA256 hash of a request body.
-
-        This logic needs to be same for both the agent who signs the payload and the client verifier.
-        """
-        body_str = json.dumps(
+    @staticmethod
+    def encode_push_notification_body(data: dict[str, Any]) -> bytes:
+        return json.dumps(
             data,
             ensure_ascii=False,
             allow_nan=False,
             indent=None,
             separators=(",", ":"),
-        )
-        return hashlib.sha256(body_str.encode()).hexdigest()
+        ).encode()
+
+    def _calculate_request_body_sha256(self, body: bytes):
+        """Calculates the SHA256 hash of a request body.
+
+        The hash covers the exact bytes sent on the wire, so the verifier never re-serializes the payload.
+        """
+        return hashlib.sha256(body).hexdigest()
 
 
 class PushNotificationSenderAuth(PushNotificationAuth):
-    def __init__(self):
+    def __init__(self, algorithm: str = "RS256", timeout: float = 10.0, max_connections: int = 100,
+                 verified_url_ttl: int = 3600, failed_url_ttl: int = 30):
+        if algorithm not in JWT_ALGORITHMS:
+            raise ValueError(f"Unsupported JWT algorithm {algorithm}, expected one of {list(JWT_ALGORITHMS)}")
+        self.algorithm = algorithm
         self.public_keys = []
         self.private_key_jwk: PyJWK = None
+        self._jwt_headers: dict[str, str] = {}
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: httpx.AsyncClient | None = None
+        # Outcome of URL ownership checks, failures are kept for a shorter time.
+        self.cache = InMemoryCache()
+        self.verified_url_ttl = verified_url_ttl
+        self.failed_url_ttl = failed_url_ttl
+        self._url_verifications: dict[str, asyncio.Future] = {}
 
-    @staticmethod
-    async def verify_push_notification_url(url: str) -> bool:
-        async with httpx.AsyncClient(timeout=10) as client:
-            try:
-                validation_token = str(uuid.uuid4())
-                response = await client.get(
-                    url,
-                    params={"validationToken": validation_token}
-                )
-                response.raise_for_status()
-                is_verified = response.text == validation_token
-
-                logger.info(f"Verified push-notification URL: {url} => {is_verified}")
-                return is_verified
-            except Exception as e:
-                logger.warning(f"Error during sending push-notification for URL {url}: {e}")
-
-        return False
-
-    def generate_jwk(self):
-        key = jwk.JWK.generate(kty='RSA', size=2048, kid=str(uuid.uuid4()), use="sig")
-        self.public_keys.append(key.export_public(as_dict=True))
-        self.private_key_jwk = PyJWK.from_json(key.export_private())
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Client shared by every notification, keeping connections to webhooks alive."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def verify_push_notification_url(self, url: str) -> bool:
+        """Checks the ownership of a webhook URL, reusing the outcome of recent checks.
+
+        Concurrent checks of the same URL share a single challenge request.
+        """
+        is_verified = self.cache.get(f"push_notification_url:{url}")
+        if is_verified is not None:
+            return is_verified
+
+        verification = self._url_verifications.get(url)
+        if verification is None:
+            verification = asyncio.ensure_future(self._verify_push_notification_url(url))
+            self._url_verifications[url] = verification
+            verification.add_done_callback(lambda _: self._url_verifications.pop(url, None))
+        # Shielded so a cancelled caller does not abort the check shared with the others.
+        return await asyncio.shield(verification)
+
+    async def _verify_push_notification_url(self, url: str) -> bool:
+        is_verified = False
+        try:
+            validation_token = str(uuid.uuid4())
+            response = await self.client.get(
+                url,
+                params={"validationToken": validation_token}
+            )
+            response.raise_for_status()
+            is_verified = response.text == validation_token
+
+            logger.info(f"Verified push-notification URL: {url} => {is_verified}")
+        except Exception as e:
+            logger.warning(f"Error during sending push-notification for URL {url}: {e}")
+
+        ttl = self.verified_url_ttl if is_verified else self.failed_url_ttl
+        self.cache.set(f"push_notification_url:{url}", is_verified, ttl)
+        return is_verified
+
+    def generate_jwk(self, key_file: str | None = None):
+        """Sets up the signing key, loaded from `key_file` when it exists.
+
+        A generated key is written to `key_file` so restarts keep the key ids
+        cached by receivers valid. Raises ValueError when the loaded key does not
+        match the configured algorithm.
+        """
+        if key_file is not None and os.path.exists(key_file):
+            with open(key_file) as f:
+                key = jwk.JWK.from_json(f.read())
+            logger.info(f"Loaded push-notification signing key {key.key_id} from {key_file}")
+        else:
+            key = jwk.JWK.generate(**JWT_ALGORITHMS[self.algorithm], kid=str(uuid.uuid4()), use="sig")
+            if key_file is not None:
+                fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as f:
+                    f.write(key.export_private())
+
+        private_key_jwk = PyJWK.from_json(key.export_private())
+        if private_key_jwk.algorithm_name != self.algorithm:
+            raise ValueError(
+                f"Push-notification signing key in {key_file} is a {private_key_jwk.algorithm_name} key, "
+                f"expected {self.algorithm}: remove the file to generate a new key"
+            )
+
+        public_key = key.export_public(as_dict=True)
+        self.private_key_jwk = private_key_jwk
+        public_key["alg"] = self.algorithm
+        self.public_keys.append(public_key)
+        self._jwt_headers = {"kid": self.private_key_jwk.key_id}
 
     def handle_jwks_endpoint(self, _request: Request):
         """Allow clients to fetch public keys.
@@ -69,7 +153,7 @@ class PushNotificationSenderAuth(PushNotificationAuth):
             "keys": self.public_keys
         })
 
-    def _generate_jwt(self, data: dict[str, Any]):
+    def _generate_jwt(self, body: bytes):
         """JWT is generated by signing both the request payload SHA digest and time of token generation.
 
         Payload is signed with private key and it ensures the integrity of payload for client.
@@ -79,35 +163,120 @@ class PushNotificationSenderAuth(PushNotificationAuth):
         iat = int(time.time())
 
         return jwt.encode(
-            {"iat": iat, "request_body_sha256": self._calculate_request_body_sha256(data)},
-            key=self.private_key_jwk,
-            headers={"kid": self.private_key_jwk.key_id},
-            algorithm="RS256"
+            {"iat": iat, "request_body_sha256": self._calculate_request_body_sha256(body)},
+            key=self.private_key_jwk.key,
+            headers=self._jwt_headers,
+            algorithm=self.algorithm
+        )
+
+    async def deliver_push_notification(self, url: str, body: bytes):
+        """Posts a signed JSON body as is, raising httpx.HTTPError when it is not accepted."""
+        # Signing is CPU bound, it runs in a thread to keep the event loop responsive.
+        jwt_token = await asyncio.to_thread(self._generate_jwt, body)
+        headers = {'Authorization': f"Bearer {jwt_token}", 'Content-Type': "application/json"}
+        response = await self.client.post(
+            url,
+            content=body,
+            headers=headers
         )
+        response.raise_for_status()
+        logger.info(f"Push-notification sent for URL: {url}")
 
     async def send_push_notification(self, url: str, data: dict[str, Any]):
-        jwt_token = self._generate_jwt(data)
-        headers = {'Authorization': f"Bearer {jwt_token}"}
-        async with httpx.AsyncClient(timeout=10) as client:
-            try:
-                response = await client.post(
-                    url,
-                    json=data,
-                    headers=headers
-                )
-                response.raise_for_status()
-                logger.info(f"Push-notification sent for URL: {url}")
-            except Exception as e:
-                logger.warning(f"Error during sending push-notification for URL {url}: {e}")
+        try:
+            await self.deliver_push_notification(url, self.encode_push_notification_body(data))
+        except Exception as e:
+            logger.warning(f"Error during sending push-notification for URL {url}: {e}")
 
 
 class PushNotificationReceiverAuth(PushNotificationAuth):
-    def __init__(self):
+    """Verifies push notifications against the sender's JWKS, fetched asynchronously.
+
+    Keys are indexed by kid. Once `jwks_ttl` has elapsed the cached keys keep
+    being used while they are refreshed in the background, and a token with an
+    unknown kid triggers a refresh, at most one every `min_refresh_interval`.
+    """
+
+    def __init__(self, jwks_ttl: float = 300.0, min_refresh_interval: float = 10.0, timeout: float = 10.0):
         self.public_keys_jwks = []
-        self.jwks_client = None
+        self.jwks_url: str | None = None
+        self.jwks_ttl = jwks_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self.signing_keys: dict[str, PyJWK] = {}
+        self.jwks_fetched_at = 0.0
+        self._last_jwks_fetch = float("-inf")
+        self._jwks_refresh: asyncio.Task | None = None
+        self._client: httpx.AsyncClient | None = None
 
     async def load_jwks(self, jwks_url: str):
-        self.jwks_client = PyJWKClient(jwks_url)
+        self.jwks_url = jwks_url
+        await self._refresh_jwks()
+
+    async def get_signing_key(self, kid: str) -> PyJWK:
+        now = time.monotonic()
+        signing_key = self.signing_keys.get(kid)
+        if signing_key is not None:
+            if now - self.jwks_fetched_at > self.jwks_ttl and self._can_refresh_jwks(now):
+                # Stale keys are served while the refresh runs in the background.
+                self._start_jwks_refresh()
+            return signing_key
+
+        if self._can_refresh_jwks(now) or self._jwks_refresh is not None:
+            await self._refresh_jwks()
+            signing_key = self.signing_keys.get(kid)
+        if signing_key is None:
+            raise ValueError(f"Unknown signing key {kid}")
+        return signing_key
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _can_refresh_jwks(self, now: float) -> bool:
+        return self._jwks_refresh is None and now - self._last_jwks_fetch >= self.min_refresh_interval
+
+    def _start_jwks_refresh(self) -> asyncio.Task:
+        if self._jwks_refresh is None:
+            self._jwks_refresh = asyncio.create_task(self._fetch_jwks())
+            self._jwks_refresh.add_done_callback(self._on_jwks_refreshed)
+        return self._jwks_refresh
+
+    def _on_jwks_refreshed(self, refresh: asyncio.Task):
+        self._jwks_refresh = None
+        if not refresh.cancelled() and refresh.exception() is not None:
+            logger.warning(f"Error while fetching JWKS from {self.jwks_url}: {refresh.exception()}")
+
+    async def _refresh_jwks(self):
+        refresh = self._start_jwks_refresh()
+        try:
+            await asyncio.shield(refresh)
+        except Exception as e:
+            if not self.signing_keys:
+                raise
+            logger.warning(f"Using cached JWKS after a failed refresh: {e}")
+
+    async def _fetch_jwks(self):
+        self._last_jwks_fetch = time.monotonic()
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        response = await self._client.get(self.jwks_url)
+        response.raise_for_status()
+
+        public_keys = response.json()["keys"]
+        signing_keys = {}
+        for public_key in public_keys:
+            try:
+                signing_key = PyJWK(public_key)
+            except jwt.PyJWKError as e:
+                logger.warning(f"Ignoring unusable JWK {public_key.get('kid')}: {e}")
+                continue
+            signing_keys[signing_key.key_id] = signing_key
+
+        self.public_keys_jwks = public_keys
+        self.signing_keys = signing_keys
+        self.jwks_fetched_at = time.monotonic()
 
     async def verify_push_notification(self, request: Request) -> bool:
         auth_header = request.headers.get("Authorization")
@@ -116,16 +285,16 @@ class PushNotificationReceiverAuth(PushNotificationAuth):
             return False
 
         token = auth_header[len(AUTH_HEADER_PREFIX):]
-        signing_key = self.jwks_client.get_signing_key_from_jwt(token)
+        signing_key = await self.get_signing_key(jwt.get_unverified_header(token).get("kid"))
 
         decode_token = jwt.decode(
             token,
             signing_key,
             options={"require": ["iat", "request_body_sha256"]},
-            algorithms=["RS256"],
+            algorithms=[signing_key.algorithm_name],
         )
 
-        actual_body_sha256 = self._calculate_request_body_sha256(await request.json())
+        actual_body_sha256 = self._calculate_request_body_sha256(await request.body())
         if actual_body_sha256 != decode_token["request_body_sha256"]:
             # Payload signature does not match the digest in signed token.
             raise ValueError("Invalid request body")
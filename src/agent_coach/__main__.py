@@ -1,3 +1,5 @@
+import os
+
 from dotenv import load_dotenv
 
 from a2a.server.base_agent import BaseAgent
@@ -14,8 +16,8 @@ _HOST = "localhost"
 _PORT = "8000"
 
 
-notification_sender_auth = PushNotificationSenderAuth()
-notification_sender_auth.generate_jwk()
+notification_sender_auth = PushNotificationSenderAuth(algorithm=os.getenv("PUSH_NOTIFICATION_JWT_ALGORITHM", "RS256"))
+notification_sender_auth.generate_jwk(os.getenv("PUSH_NOTIFICATION_KEY_FILE"))
 agent : BaseAgent = CoachAgent()
 
 server = A2AServer(
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 import uuid
 from typing import Literal, Union
 
@@ -14,9 +15,9 @@ from langgraph.types import Command, StreamWriter
 from pydantic import BaseModel, Field
 
 from a2a.client.client import A2AClient
-from a2a.common.types import TaskSendParams, Message, TextPart, TaskState, \
+from a2a.common.types import AgentCard, TaskSendParams, Message, TextPart, TaskState, \
     TaskStatusUpdateEvent, TaskArtifactUpdateEvent
-from a2a.utils.card_resolver import A2ACardResolver
+from a2a.utils.card_resolver import resolve_agent_cards
 from agent_supervisor.logger import StdoutLogger
 from agent_supervisor.model import AgentState
 from agent_supervisor.utils import convert_a2a_task_result_to_langchain, convert_a2a_task_events_to_langchain, \
@@ -27,14 +28,45 @@ logger = StdoutLogger(name="MonLogger", level=logging.DEBUG)
 # Initialize the LLM model
 llm = ChatOpenAI(model="gpt-4o-mini")
 
-# Load assistant cards
-assistant_cards = {
-    agent.name: agent
-    for agent in [
-        A2ACardResolver("http://localhost:9000").get_agent_card(),
-        A2ACardResolver("http://localhost:8000").get_agent_card()
-    ]
-}
+# Remote assistants, their cards are resolved on first use and refreshed once
+# their cache expires, so the supervisor starts without waiting for the agents.
+ASSISTANT_URLS = ["http://localhost:9000", "http://localhost:8000"]
+ASSISTANT_CARD_TTL = 300
+# Seconds before an assistant whose card could not be resolved is contacted again.
+ASSISTANT_RETRY_INTERVAL = 30
+assistant_cards: dict[str, AgentCard] = {}
+# Base URL of each assistant by name, learned from its card.
+assistant_urls: dict[str, str] = {}
+unreachable_until: dict[str, float] = {}
+
+
+async def get_assistant_card(name: str) -> AgentCard | None:
+    """Resolves the card of one assistant, a turn never waits on the other assistants."""
+    base_url = assistant_urls.get(name)
+    if base_url is not None:
+        base_urls = [base_url]
+    else:
+        known_urls = set(assistant_urls.values())
+        base_urls = [url for url in ASSISTANT_URLS if url not in known_urls]
+
+    now = time.monotonic()
+    base_urls = [url for url in base_urls if now >= unreachable_until.get(url, 0)]
+    if base_urls:
+        await resolve_assistant_cards(base_urls)
+    # Agents which cannot be reached keep their last known card.
+    return assistant_cards.get(name)
+
+
+async def resolve_assistant_cards(base_urls: list[str]):
+    cards = await resolve_agent_cards(base_urls, ttl=ASSISTANT_CARD_TTL)
+    for base_url in base_urls:
+        card = cards.get(base_url)
+        if card is None:
+            unreachable_until[base_url] = time.monotonic() + ASSISTANT_RETRY_INTERVAL
+            continue
+        unreachable_until.pop(base_url, None)
+        assistant_cards[card.name] = card
+        assistant_urls[card.name] = base_url
 
 
 class SupervisorMessageChunk(BaseModel):
@@ -189,70 +221,81 @@ async def call_default_agent(state: AgentState, writer: StreamWriter):
 
 async def call_remote_agent(state: AgentState, config: RunnableConfig, writer: StreamWriter):
     current_agent_name = state["active_agent"]
-    card = assistant_cards[current_agent_name]
+    card = await get_assistant_card(current_agent_name)
+    if card is None:
+        logger.info(f"Remote agent {current_agent_name} is not available")
+        return {
+            "messages": [AIMessage(content=f"The agent {current_agent_name} is not available at the moment.")],
+            "task_state": TaskState.COMPLETED
+        }
+    # The client's connection pool is bound to the event loop of the turn, UIs such as
+    # mesop run each turn on a new loop, so it is closed when the turn ends.
     agent_cli = A2AClient(agent_card=card, url=card.url)
+    try:
+        parts = [TextPart(text=state['messages'][-1].content)]
+        params = TaskSendParams(
+            id=state.get("task_id") or str(uuid.uuid4()),
+            sessionId=config['configurable']['thread_id'],
+            message=Message(role="user", parts=parts),
+            pushNotification=None,
+            historyLength=None,
+            metadata=None
+        )
 
-    parts = [TextPart(text=state['messages'][-1].content)]
-    params = TaskSendParams(
-        id=state.get("task_id") or str(uuid.uuid4()),
-        sessionId=config['configurable']['thread_id'],
-        message=Message(role="user", parts=parts),
-        pushNotification=None,
-        historyLength=None,
-        metadata=None
-    )
+        if card.capabilities.streaming:
 
-    if card.capabilities.streaming:
+            logger.info(f"Call remote agent {current_agent_name} in streaming mode")
+            buffer: list[Union[TaskStatusUpdateEvent, TaskArtifactUpdateEvent]] = []
+            queue = asyncio.Queue(maxsize=0)
 
-        logger.info(f"Call remote agent {current_agent_name} in streaming mode")
-        buffer: list[Union[TaskStatusUpdateEvent, TaskArtifactUpdateEvent]] = []
-        queue = asyncio.Queue(maxsize=0)
+            async def next_message(q):
+                async for event in agent_cli.send_task_streaming(payload=params):
+                    await q.put(event.result)
+                await q.put(QueueEndEvent())
 
-        async def next_message(q):
-            async for event in agent_cli.send_task_streaming(payload=params):
-                await q.put(event.result)
-            await q.put(QueueEndEvent())
+            asyncio.create_task(next_message(queue))
 
-        asyncio.create_task(next_message(queue))
+            while True:
+                event: Union[TaskStatusUpdateEvent, TaskArtifactUpdateEvent, QueueEndEvent] = await queue.get()
+                if isinstance(event, QueueEndEvent):
+                    break
 
-        while True:
-            event: Union[TaskStatusUpdateEvent, TaskArtifactUpdateEvent, QueueEndEvent] = await queue.get()
-            if isinstance(event, QueueEndEvent):
-                break
+                buffer.append(event)
+                # Output of a working task arrives as artifact chunks, the last chunk repeats the full answer.
+                if isinstance(event, TaskArtifactUpdateEvent) and event.artifact.lastChunk is False:
+                    for part in event.artifact.parts:
+                        ui_event = MessageEvent(
+                            content=part.text,
+                            id=event.id,
+                            agent=state["active_agent"]
+                        )
+                        writer(ui_event)
 
-            buffer.append(event)
-            if isinstance(event, TaskStatusUpdateEvent) and event.status.state == TaskState.WORKING:
-                for part in event.status.message.parts:
-                    ui_event = MessageEvent(
-                        content=part.text,
-                        id=event.id,
-                        agent=state["active_agent"]
-                    )
-                    writer(ui_event)
+            last_state = buffer[-1].status.state
+
+            ai_message = convert_a2a_task_events_to_langchain(buffer)
 
-        last_state = buffer[-1].status.state
+            logger.info(f"Remote agent {current_agent_name} streaming response completed")
 
-        ai_message = convert_a2a_task_events_to_langchain(buffer)
+            return {
+                "task_state": last_state,
+                "messages": [ai_message],
+                "task_id": params.id
+            }
 
-        logger.info(f"Remote agent {current_agent_name} streaming response completed")
+
+        logger.info(f"Call remote agent {current_agent_name} in standard mode")
+        res = await agent_cli.send_task(payload=params)
+        lc_messages = convert_a2a_task_result_to_langchain(res.result)
+        logger.info(f"Remote agent {current_agent_name} response completed")
 
         return {
-            "task_state": last_state,
-            "messages": [ai_message],
+            "task_state": res.result.status.state,
+            "messages": lc_messages,
             "task_id": params.id
         }
-
-
-    logger.info(f"Call remote agent {current_agent_name} in standard mode")
-    res = await agent_cli.send_task(payload=params)
-    lc_messages = convert_a2a_task_result_to_langchain(res.result)
-    logger.info(f"Remote agent {current_agent_name} response completed")
-
-    return {
-        "task_state": res.result.status.state,
-        "messages": lc_messages,
-        "task_id": params.id
-    }
+    finally:
+        await agent_cli.close()
 
 
 # Define the state graph
@@ -17,20 +17,29 @@ class MessageEvent(TypedDict):
 def convert_a2a_task_events_to_langchain(events :  list[Union[TaskStatusUpdateEvent, TaskArtifactUpdateEvent]]) -> AIMessage:
 
     content = ""
+    # Artifact chunks sent with `append` extend the text of the same index, others replace it.
+    artifacts: dict[int, str] = {}
 
     for event in events :
         if isinstance(event, TaskStatusUpdateEvent):
-            if "message" in event.status :
-                if "parts" in event.status.message and event.status.message.parts is not None:
-                    for part in event.status.message.parts:
-                        content += part.text
+            if event.status.message is not None and event.status.message.parts is not None:
+                if event.final:
+                    # A final message, e.g. asking for input, repeats the text streamed as artifact chunks.
+                    artifacts.clear()
+                for part in event.status.message.parts:
+                    content += part.text
 
 
         if isinstance(event, TaskArtifactUpdateEvent):
             if event.artifact is not None :
                 if event.artifact.parts is not None:
-                    for part in event.artifact.parts:
-                        content += part.text
+                    text = "".join(part.text for part in event.artifact.parts)
+                    if event.artifact.append:
+                        artifacts[event.artifact.index] = artifacts.get(event.artifact.index, "") + text
+                    else:
+                        artifacts[event.artifact.index] = text
+
+    content += "".join(artifacts[index] for index in sorted(artifacts))
 
     return AIMessage(content=content)
 